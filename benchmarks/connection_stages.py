@@ -0,0 +1,123 @@
+"""
+Measures the per-item overhead of Connection, with and without stages,
+at several page lengths. Pages are served by a fake collector without
+any I/O, so the numbers are the cost of iteration and staging alone.
+
+    python benchmarks/connection_stages.py [--items N] [--repeat N]
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Awaitable, Callable
+
+import argparse
+import asyncio
+import time
+
+from github import Connection
+
+
+PAGE_LENGTHS: tuple[int, ...] = (10, 25, 50, 100)
+
+
+def make_collector(
+    items: int,
+    page_length: int,
+    /,
+) -> Callable[..., Awaitable[dict[str, object]]]:
+    nodes = [{"id": f"U{i}", "login": f"user-{i}", "databaseId": i} for i in range(items)]
+
+    async def collector(*, cursor: str | None, length: int | None, reverse: bool, **kwargs) -> dict[str, object]:
+        start = int(cursor) if cursor is not None else 0
+        stop = min(start + page_length, items)
+
+        return {
+            "nodes": nodes[start:stop],
+            "pageInfo": {"endCursor": str(stop), "hasNextPage": stop < items},
+        }
+
+    return collector
+
+
+async def async_identity(
+    value: object,
+    /,
+) -> object:
+    return value
+
+
+def apply_none(
+    connection: Connection,
+    /,
+) -> Connection:
+    return connection
+
+
+def apply_sync(
+    connection: Connection,
+    /,
+) -> Connection:
+    return connection.map(lambda n: n["databaseId"]).filter(lambda i: i % 3 != 0).map(lambda i: i * 2)
+
+
+def apply_async(
+    connection: Connection,
+    /,
+) -> Connection:
+    return connection.map(async_identity).filter(lambda n: n["databaseId"] % 3 != 0).map(async_identity)
+
+
+def apply_concurrent(
+    connection: Connection,
+    /,
+) -> Connection:
+    return connection.map(async_identity, concurrency=8).filter(lambda n: n["databaseId"] % 3 != 0)
+
+
+STAGES: dict[str, Callable[[Connection], Connection]] = {
+    "none": apply_none,
+    "sync": apply_sync,
+    "async": apply_async,
+    "concurrent": apply_concurrent,
+}
+
+
+async def run(
+    items: int,
+    page_length: int,
+    apply: Callable[[Connection], Connection],
+    /,
+) -> float:
+    connection = apply(Connection(make_collector(items, page_length)))
+
+    start = time.perf_counter()
+
+    async for _ in connection:
+        pass
+
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000, help="the number of items in the connection")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of runs to take the best of")
+    args = parser.parse_args()
+
+    print(f"{args.items} items, best of {args.repeat} runs, us per item")
+    print(f"{'stages':<12}" + "".join(f"{f'page {n}':>12}" for n in PAGE_LENGTHS))
+
+    for (name, apply) in STAGES.items():
+        row = f"{name:<12}"
+
+        for page_length in PAGE_LENGTHS:
+            best = min([await run(args.items, page_length, apply) for _ in range(args.repeat)])
+            row += f"{best / args.items * 1e6:>12.2f}"
+
+        print(row)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
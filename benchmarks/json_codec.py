@@ -0,0 +1,108 @@
+"""
+Compares the JSON codecs a client can be given on synthetic payloads
+shaped like GitHub's GraphQL responses.
+
+    python benchmarks/json_codec.py [--nodes N] [--number N]
+
+Codecs whose module is not installed are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+from github import JSONCodec
+
+
+MODULES: tuple[str, ...] = ("json", "orjson", "ujson")
+
+
+def make_user(
+    i: int,
+    /,
+) -> dict[str, object]:
+    return {
+        "__typename": "User",
+        "avatarUrl": f"https://avatars.githubusercontent.com/u/{i}?v=4",
+        "bio": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. ✨" * (i % 3),
+        "company": None if i % 2 else "@example",
+        "createdAt": "2015-03-14T15:09:26Z",
+        "databaseId": i,
+        "followers": {"totalCount": i * 7},
+        "following": {"totalCount": i * 3},
+        "id": f"MDQ6VXNlcj{i:08d}",
+        "isHireable": bool(i % 2),
+        "isSiteAdmin": False,
+        "isViewer": False,
+        "location": "Earth",
+        "login": f"user-{i}",
+        "name": f"User {i}",
+        "pronouns": None,
+        "resourcePath": f"/user-{i}",
+        "twitterUsername": None,
+        "updatedAt": "2023-01-01T00:00:00Z",
+        "url": f"https://github.com/user-{i}",
+        "viewerCanFollow": True,
+        "viewerIsFollowing": False,
+        "websiteUrl": None,
+    }
+
+
+def make_response(
+    nodes: int,
+    /,
+) -> dict[str, object]:
+    return {
+        "data": {
+            "node": {
+                "stargazers": {
+                    "nodes": [make_user(i) for i in range(nodes)],
+                    "pageInfo": {"endCursor": "Y3Vyc29yOnYyOpHOAAAAAQ==", "hasNextPage": True, "hasPreviousPage": False, "startCursor": "Y3Vyc29yOnYyOpHOAAAAAA=="},
+                },
+            },
+        },
+    }
+
+
+def make_request(
+    nodes: int,
+    /,
+) -> dict[str, object]:
+    fields = ",".join(make_user(0).keys())
+
+    return {
+        "operationName": None,
+        "query": "query($after:String,$first:Int,$starrable_id:ID!){node(id:$starrable_id){...on Starrable{stargazers(after:$after,first:$first){nodes{%s},pageInfo{endCursor,hasNextPage}}}}}" % fields,
+        "variables": {"after": "Y3Vyc29yOnYyOpHOAAAAAQ==", "first": nodes, "starrable_id": "MDEwOlJlcG9zaXRvcnkx"},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=100, help="the number of nodes in each response")
+    parser.add_argument("--number", type=int, default=1000, help="the number of times to run each operation")
+    args = parser.parse_args()
+
+    request = make_request(args.nodes)
+    response = json.dumps(make_response(args.nodes)).encode("utf-8")
+
+    print(f"request: {len(json.dumps(request))} bytes, response: {len(response)} bytes, {args.number} runs")
+    print(f"{'codec':<8} {'dumps (us)':>12} {'loads (us)':>12}")
+
+    for name in MODULES:
+        try:
+            codec = JSONCodec.from_module(name)
+        except ImportError:
+            print(f"{name:<8} {'not installed':>25}")
+            continue
+
+        dumps = timeit.timeit(lambda: codec.dumps(request), number=args.number) / args.number
+        loads = timeit.timeit(lambda: codec.loads(response), number=args.number) / args.number
+
+        print(f"{name:<8} {dumps * 1e6:>12.1f} {loads * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,23 @@ if TYPE_CHECKING:
     from typing import Any, AsyncIterator, Awaitable, Callable, Final, cast, type_check_only
     from typing_extensions import Self
 
+    from github.core.client import Client
+    from github.interfaces import Type
+
     _T = TypeVar("_T")
 
-from github.core.http import DEFAULT_MAXIMUM_NODES, DEFAULT_MINIMUM_NODES
+import asyncio
+import collections
+import functools
+import inspect
+import json
+import logging
+import time
+import weakref
+
+import github
+from github.core.errors import ClientResponseGraphQLMaximumNodeLimitExceededError
+from github.core.http import DEFAULT_MAXIMUM_NODES, DEFAULT_MINIMUM_NODES, MAXIMUM_PAGE_NODES
 from github import utility
 from github.utility import MISSING
 
@@ -35,6 +49,16 @@ if TYPE_CHECKING:
         startCursor: str
 
 
+CHECKPOINT_VERSION: int = 1
+DEFAULT_LATENCY: float = 1.0
+
+
+log = logging.getLogger(__name__)
+
+
+_STREAM_END: Any = object()
+
+
 _Tci = TypeVar("_Tci")
 
 if not TYPE_CHECKING:
@@ -62,10 +86,29 @@ class Connection(AsyncIterator[_Tci]):
         "_data_filter",
         "_data_map",
         "_stages",
+        "_compiled_stages",
         "_buffer",
+        "_closed",
         "_done",
         "_locked",
         "_paginating",
+        "_prefetch",
+        "_prefetch_queue",
+        "_prefetch_task",
+        "_split",
+        "_split_index",
+        "_split_queues",
+        "_split_tasks",
+        "_data_type",
+        "_next_cursor",
+        "_pages",
+        "_skip",
+        "_adaptive",
+        "_page_length",
+        "_stream",
+        "_stream_queue",
+        "_stream_task",
+        "__weakref__",
     )
 
     def __init__(
@@ -75,6 +118,7 @@ class Connection(AsyncIterator[_Tci]):
         *args: Any,
         data_filter: Callable[[Any], bool | Awaitable[bool]] | None = MISSING,
         data_map: Callable[[Any], _Tci | Awaitable[_Tci]] | None = MISSING,
+        data_type: type[Type] | None = MISSING,
         length: int | None = MISSING,
         limit: int | None = MISSING,
         **kwargs: Any,
@@ -86,6 +130,7 @@ class Connection(AsyncIterator[_Tci]):
         self._args: tuple[Any, ...] = args
         self._kwargs: dict[str, Any] = kwargs
         self._kwargs.setdefault("cursor", None)
+        self._kwargs.setdefault("length", None)
         self._kwargs.setdefault("reverse", False)
 
         # NOTE: the initial stages (see below for the user
@@ -93,117 +138,974 @@ class Connection(AsyncIterator[_Tci]):
         self._data_filter: Callable[[Any], bool | Awaitable[bool]] | None = data_filter if data_filter is not MISSING else None
         self._data_map: Callable[[Any], _Tci | Awaitable[_Tci]] | None = data_map if data_map is not MISSING else None
 
+        # NOTE: the type to which data_map maps, recorded by name in
+        #       checkpoints. when data_map is not provided, data is
+        #       mapped to this type
+        self._data_type: type[Type] | None = data_type if data_type is not MISSING else None
+
+        if self._data_map is None and self._data_type is not None:
+            from_data = functools.partial(self._data_type._from_data, http=getattr(collector, "__self__", None))
+
+            if TYPE_CHECKING:
+                from_data = cast(Callable[[Any], _Tci], from_data)
+
+            self._data_map = from_data
+
         # NOTE: collects manipulation steps ("stages") for subsequent
         #       calling on each item in the graph response, properly
         #       supporting i.map(a_to_b).filter(b_with_x).map(b_to_c)
         # TODO: the current implementation is a little jank; i'd prefer
         #       tuple[ManipulationType, Callable] but with only filter
         #       and map i probably won't bother
-        self._stages: list[tuple[str, Callable[..., Any]]] = list()
+        self._stages: list[tuple[str, Callable[..., Any], int | None, bool]] = list()
+
+        # NOTE: (is_filter, function, is_async, concurrency, ordered)
+        #       for each stage including the initial stages, compiled on
+        #       first iteration. is_async is None until the first call
+        #       of a function which is not a coroutine function tells us
+        #       whether it returns an awaitable
+        self._compiled_stages: list[tuple[bool, Callable[..., Any], bool | None, int | None, bool]] | None = None
 
-        self._buffer: list[_Tci] = list()
+        self._buffer: collections.deque[_Tci] = collections.deque()
+        self._closed: bool = False
         self._done: bool = False
         self._locked: bool = False
         self._paginating: bool = False
 
+        self._prefetch: int = 0
+        self._prefetch_queue: asyncio.Queue[ConnectionData[Any] | BaseException] | None = None
+        self._prefetch_task: asyncio.Task[None] | None = None
+
+        self._split: int = 0
+        self._split_index: int = 0
+        self._split_queues: list[asyncio.Queue[list[Any] | BaseException | None]] | None = None
+        self._split_tasks: list[asyncio.Task[None]] = list()
+
+        # NOTE: [cursor, yielded, remaining] for each page with items in
+        #       the buffer, where cursor is the cursor the page was
+        #       requested with, such that a checkpoint can resume from
+        #       the first item which has not been yielded
+        self._next_cursor: str | None = self._kwargs["cursor"]
+        self._pages: collections.deque[list[Any]] = collections.deque()
+        self._skip: int = 0
+
+        # NOTE: (minimum, maximum, latency) when the page length adapts
+        #       to the responses, see Connection.adaptive
+        self._adaptive: tuple[int, int, float] | None = None
+        self._page_length: int = self._length or DEFAULT_MAXIMUM_NODES
+
+        self._stream: bool = False
+        self._stream_queue: asyncio.Queue[Any] | None = None
+        self._stream_task: asyncio.Task[None] | None = None
+
     def __aiter__(
         self: Self,
         /,
     ) -> Self:
         return self
 
+    async def __aenter__(
+        self: Self,
+        /,
+    ) -> Self:
+        return self
+
+    async def __aexit__(
+        self: Self,
+        /,
+        *args: Any,
+    ) -> None:
+        await self.aclose()
+
+    def __del__(
+        self: Self,
+        /,
+    ) -> None:
+        # NOTE: cancels the requests of a connection which was abandoned
+        #       before it was exhausted, such as by breaking out of an
+        #       async for loop
+        try:
+            self._cancel_tasks()
+        except (AttributeError, RuntimeError):
+            # NOTE: the connection was not initialized, or the event
+            #       loop is closed
+            pass
+
     async def __anext__(
         self: Self,
         /,
     ) -> _Tci:
         self._locked = True
 
+        if self._closed:
+            raise StopAsyncIteration
+
         if self._limit is not None:
             if self._limit <= 0:
                 # NOTE: we have already yielded the number of elements
                 #       the user requested
+                self._cancel_tasks()
                 raise StopAsyncIteration
 
+        if self._stream and not self._paginating:
+            return await self._anext_streamed()
+
         if not self._paginating and self._buffer:
             if self._limit is not None:
                 self._limit -= 1
 
-            return self._buffer.pop(0)
+            self._consume(1)
+            return self._buffer.popleft()
 
-        if self._done:
+        if self._done and not self._buffer:
             # NOTE: the connection contains no more elements
             raise StopAsyncIteration
 
-        if self._limit is not None:
+        if self._limit is not None and self._adaptive is None:
             self._kwargs["length"] = max(DEFAULT_MINIMUM_NODES, min(self._limit, self._length or DEFAULT_MAXIMUM_NODES))
 
-        if self._paginating:
-            staged_nodes = self._buffer
-            self._buffer.clear()
-        else:
-            staged_nodes = list()
-
         cursor_name = "startCursor" if self._kwargs["reverse"] else "endCursor"
         page_name = "hasPreviousPage" if self._kwargs["reverse"] else "hasNextPage"
 
-        while not self._done and ((not self._paginating and not staged_nodes) or (self._paginating and self._length is not None and len(staged_nodes) < self._length)):
-            data = await self._collector(*self._args, **self._kwargs)
+        # NOTE: a paginated connection without a length yields each
+        #       page as it is received
+        minimum_length = self._length if self._paginating and self._length is not None else 1
 
-            nodes, next_cursor, has_next_page = data["nodes"], data["pageInfo"][cursor_name], data["pageInfo"][page_name]
+        while not self._done and len(self._buffer) < minimum_length:
+            data = await self._collect(cursor_name)
+
+            nodes, has_next_page = data["nodes"], data["pageInfo"][page_name]
 
-            self._kwargs["cursor"] = next_cursor
             self._done = not has_next_page
 
-            for node in nodes:
-                if self._data_filter is not None:
-                    if not await utility.call_maybe_coroutine(self._data_filter, node):
-                        continue
+            page_cursor = self._next_cursor
+            self._next_cursor = data["pageInfo"].get(cursor_name)
 
-                if self._data_map is not None:
-                    staged_node = await utility.call_maybe_coroutine(self._data_map, node)
-                else:
-                    staged_node = node
+            if self._compiled_stages is None:
+                self._compiled_stages = self._compile_stages()
+
+            staged_nodes = await self._stage_page(nodes)
 
-                filter = False
+            skip = 0
 
-                for stage_type, stage in self._stages:
-                    if stage_type == "filter":
-                        if not await utility.call_maybe_coroutine(stage, staged_node):
-                            filter = True
-                    elif stage_type == "map":
-                        staged_node = await utility.call_maybe_coroutine(stage, staged_node)
-                    else:
-                        raise RuntimeError("invalid stage type; this shouldn't happen")
+            if self._skip:
+                # NOTE: the items yielded before the checkpoint this
+                #       connection was restored from
+                skip, self._skip = min(self._skip, len(staged_nodes)), 0
+                del staged_nodes[:skip]
 
-                if filter:
-                    continue
+            if staged_nodes:
+                self._pages.append([page_cursor, skip, len(staged_nodes)])
 
-                staged_nodes.append(staged_node)
+            # NOTE: hands off the page in a single chunk
+            self._buffer.extend(staged_nodes)
 
-        if not staged_nodes and self._done:
+        if not self._buffer:
             # NOTE: the connection contains no more elements and we
             #       filtered away the current page, or the connection
             #       was empty
             raise StopAsyncIteration
 
         if self._paginating:
+            length = min(self._length or len(self._buffer), len(self._buffer))
+
+            if self._limit is not None:
+                length = min(length, self._limit)
+                self._limit -= length
+
+            self._consume(length)
+
+            popleft = self._buffer.popleft
+            return [popleft() for _ in range(length)]  # type: ignore  # NOTE: this is magic, see Connection.paginate
+
+        if self._limit is not None:
+            self._limit -= 1
+
+        self._consume(1)
+        return self._buffer.popleft()
+
+    def _consume(
+        self: Self,
+        count: int,
+        /,
+    ) -> None:
+        while count:
+            page = self._pages[0]
+
+            consumed = min(count, page[2])
+            page[1] += consumed
+            page[2] -= consumed
+            count -= consumed
+
+            if not page[2]:
+                self._pages.popleft()
+
+    def _compile_stages(
+        self: Self,
+        /,
+    ) -> list[tuple[bool, Callable[..., Any], bool | None, int | None, bool]]:
+        stages = list()
+
+        if self._data_filter is not None:
+            stages.append(("filter", self._data_filter, None, True))
+
+        if self._data_map is not None:
+            stages.append(("map", self._data_map, None, True))
+
+        stages.extend(self._stages)
+
+        compiled_stages = list()
+
+        for (stage_type, stage, concurrency, ordered) in stages:
+            if stage_type not in ("filter", "map"):
+                raise RuntimeError("invalid stage type; this shouldn't happen")
+
+            compiled_stages.append((stage_type == "filter", stage, True if inspect.iscoroutinefunction(stage) else None, concurrency, ordered))
+
+        return compiled_stages
+
+    async def _stage_page(
+        self: Self,
+        nodes: list[Any],
+        /,
+    ) -> list[_Tci]:
+        if TYPE_CHECKING:
+            assert self._compiled_stages is not None
+
+        stages = self._compiled_stages
+
+        # NOTE: stages run item by item, except for concurrent stages
+        #       which run across the whole page at once, so the page is
+        #       staged in runs separated by concurrent stages
+        start = 0
+
+        while start < len(stages):
+            stop = start
+
+            while stop < len(stages) and stages[stop][3] is None:
+                stop += 1
+
+            if start < stop:
+                if all(stages[i][2] is False for i in range(start, stop)):
+                    nodes = self._stage_nodes_sync(nodes, start, stop)
+                else:
+                    nodes = await self._stage_nodes(nodes, start, stop)
+
+            if stop < len(stages):
+                nodes = await self._stage_nodes_concurrently(nodes, stop)
+
+            start = stop + 1
+
+        return nodes
+
+    async def _stage_nodes(
+        self: Self,
+        nodes: list[Any],
+        start: int,
+        stop: int,
+        /,
+    ) -> list[_Tci]:
+        if TYPE_CHECKING:
+            assert self._compiled_stages is not None
+
+        stages = self._compiled_stages
+        staged_nodes = list()
+
+        for node in nodes:
+            for i in range(start, stop):
+                (is_filter, stage, is_async, concurrency, ordered) = stages[i]
+
+                value = stage(node)
+
+                if is_async is None:
+                    is_async = inspect.isawaitable(value)
+                    stages[i] = (is_filter, stage, is_async, concurrency, ordered)
+
+                if is_async:
+                    value = await value
+
+                if is_filter:
+                    if not value:
+                        break
+                else:
+                    node = value
+            else:
+                staged_nodes.append(node)
+
+        return staged_nodes
+
+    def _stage_nodes_sync(
+        self: Self,
+        nodes: list[Any],
+        start: int,
+        stop: int,
+        /,
+    ) -> list[_Tci]:
+        if TYPE_CHECKING:
+            assert self._compiled_stages is not None
+
+        stages = self._compiled_stages[start:stop]
+        staged_nodes = list()
+
+        # NOTE: the fast path for when no stage is asynchronous, which
+        #       stages the page without suspending
+        for node in nodes:
+            for (is_filter, stage, _, _, _) in stages:
+                value = stage(node)
+
+                if is_filter:
+                    if not value:
+                        break
+                else:
+                    node = value
+            else:
+                staged_nodes.append(node)
+
+        return staged_nodes
+
+    async def _stage_nodes_concurrently(
+        self: Self,
+        nodes: list[Any],
+        index: int,
+        /,
+    ) -> list[_Tci]:
+        if TYPE_CHECKING:
+            assert self._compiled_stages is not None
+
+        (_, stage, _, concurrency, ordered) = self._compiled_stages[index]
+
+        if TYPE_CHECKING:
+            assert concurrency is not None
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(
+            node: Any,
+            /,
+        ) -> Any:
+            async with semaphore:
+                return await utility.call_maybe_coroutine(stage, node)
+
+        tasks = [asyncio.ensure_future(call(node)) for node in nodes]
+
+        try:
+            if ordered:
+                return list(await asyncio.gather(*tasks))
+            else:
+                return [await task for task in asyncio.as_completed(tasks)]
+        finally:
+            # NOTE: does nothing unless a call failed, in which case the
+            #       remaining calls are abandoned
+            for task in tasks:
+                task.cancel()
+
+    async def _collect_page(
+        self: Self,
+        kwargs: dict[str, Any],
+        /,
+    ) -> ConnectionData[Any]:
+        if self._adaptive is None:
+            return await self._collector(*self._args, **kwargs)
+
+        (minimum, maximum, latency) = self._adaptive
+
+        while True:
+            length = self._page_length
+
             if self._limit is not None:
-                self._limit -= len(staged_nodes)
+                length = max(minimum, min(self._limit, length))
+
+            kwargs["length"] = length
+
+            start = time.perf_counter()
+
+            try:
+                data = await self._collector(*self._args, _data_retry_timeout=False, **kwargs)
+            except (ClientResponseGraphQLMaximumNodeLimitExceededError, asyncio.TimeoutError) as e:
+                if length <= minimum:
+                    raise
+
+                self._set_page_length(max(minimum, length // 2), type(e).__name__)
+                continue
+
+            elapsed = time.perf_counter() - start
+
+            # NOTE: grows the page while responses are fast, and shrinks
+            #       it quickly when they are slow
+            if elapsed > latency * 2:
+                self._set_page_length(max(minimum, length // 2), f"latency {elapsed:.2f}s")
+            elif elapsed < latency and length == self._page_length:
+                self._set_page_length(min(maximum, length + max(length // 2, 1)), f"latency {elapsed:.2f}s")
+
+            return data
+
+    def _set_page_length(
+        self: Self,
+        length: int,
+        reason: str,
+        /,
+    ) -> None:
+        if length != self._page_length:
+            log.debug("page length %d -> %d (%s)", self._page_length, length, reason)
+
+        self._page_length = length
+
+    async def _collect(
+        self: Self,
+        cursor_name: str,
+        /,
+    ) -> ConnectionData[Any]:
+        if self._split > 1:
+            return await self._collect_split(cursor_name)
+
+        if not self._prefetch:
+            data = await self._collect_page(self._kwargs)
+            self._kwargs["cursor"] = data["pageInfo"][cursor_name]
+
+            return data
+
+        if self._prefetch_queue is None:
+            self._prefetch_queue = asyncio.Queue(self._prefetch)
+            page_name = "hasPreviousPage" if self._kwargs["reverse"] else "hasNextPage"
+            self._prefetch_task = asyncio.ensure_future(self._collect_ahead(weakref.ref(self), self._prefetch_queue, cursor_name, page_name))
+
+        data = await self._prefetch_queue.get()
+
+        if isinstance(data, BaseException):
+            # NOTE: the producer stops on an error, so the next call
+            #       starts another from the cursor of the failed page
+            self._prefetch_queue = None
+            self._prefetch_task = None
+
+            raise data
+
+        return data
+
+    @staticmethod
+    async def _collect_ahead(
+        reference: weakref.ref[Connection[Any]],
+        queue: asyncio.Queue[ConnectionData[Any] | BaseException],
+        cursor_name: str,
+        page_name: str,
+        /,
+    ) -> None:
+        # NOTE: requests the next page as soon as the cursor of the
+        #       current page is known, while the queue holds at most
+        #       _prefetch pages which are yet to be consumed. the
+        #       connection is only referenced while a page is being
+        #       requested, such that an abandoned connection can be
+        #       finalized while this waits on the queue
+        while True:
+            connection = reference()
+
+            if connection is None:
+                return
+
+            try:
+                data = await connection._collect_page(connection._kwargs)
+            except Exception as e:
+                del connection
+
+                await queue.put(e)
+                return
+
+            connection._kwargs["cursor"] = data["pageInfo"][cursor_name]
+            del connection
+
+            await queue.put(data)
+
+            if not data["pageInfo"][page_name]:
+                return
+
+    async def _collect_split(
+        self: Self,
+        cursor_name: str,
+        /,
+    ) -> ConnectionData[Any]:
+        if self._split_queues is None:
+            data = await self._start_split(cursor_name)
+
+            if data is not None:
+                # NOTE: the connection could not be split, see
+                #       _start_split
+                return data
+
+        if TYPE_CHECKING:
+            assert self._split_queues is not None
+
+        # NOTE: drains the ranges in order, such that the items are
+        #       yielded in the same order as they would be sequentially
+        while self._split_index < len(self._split_queues):
+            nodes = await self._split_queues[self._split_index].get()
+
+            if nodes is None:
+                self._split_index += 1
+                continue
+
+            if isinstance(nodes, BaseException):
+                raise nodes
+
+            return {"nodes": nodes, "pageInfo": {"hasNextPage": True}}  # type: ignore
+
+        return {"nodes": [], "pageInfo": {"hasNextPage": False}}  # type: ignore
+
+    async def _start_split(
+        self: Self,
+        cursor_name: str,
+        /,
+    ) -> ConnectionData[Any] | None:
+        first, last = await asyncio.gather(
+            self._collect_page(self._kwargs),
+            self._collector(*self._args, **{**self._kwargs, "cursor": None, "length": 1, "reverse": True}),
+        )
+
+        self._kwargs["cursor"] = first["pageInfo"][cursor_name]
+
+        if not first["pageInfo"]["hasNextPage"]:
+            self._split = 0
+            return first
+
+        try:
+            cursors = utility.split_cursors(first["pageInfo"]["endCursor"], last["pageInfo"]["endCursor"], self._split)
+        except ValueError as e:
+            log.warning("cannot split connection, iterating sequentially: %s", e)
+            cursors = list()
+
+        if not cursors:
+            self._split = 0
+            return first
+
+        count = len(cursors) + 1
+
+        loop = asyncio.get_running_loop()
+
+        first_ids = [loop.create_future() for _ in range(count)]
+        # NOTE: a queue of size 0 is unbounded, and split ranges are
+        #       iterated with or without prefetching
+        self._split_queues = [asyncio.Queue(max(1, self._prefetch)) for _ in range(count)]
+
+        for i in range(count):
+            if i == 0:
+                data, cursor = first, first["pageInfo"]["endCursor"]
+            else:
+                data, cursor = None, cursors[i - 1]
+
+            kwargs = {**self._kwargs, "cursor": cursor}
+            self._split_tasks.append(asyncio.ensure_future(self._collect_range(weakref.ref(self), self._split_queues[i], kwargs, data, cursor_name, first_ids, i)))
+
+        return None
+
+    @staticmethod
+    async def _collect_range(
+        reference: weakref.ref[Connection[Any]],
+        queue: asyncio.Queue[list[Any] | BaseException | None],
+        kwargs: dict[str, Any],
+        data: ConnectionData[Any] | None,
+        cursor_name: str,
+        first_ids: list[asyncio.Future[str | None]],
+        index: int,
+        /,
+    ) -> None:
+        # NOTE: a range ends where the next non-empty range begins, at
+        #       the first item it yields
+        boundary = MISSING
+
+        try:
+            while True:
+                if data is None:
+                    # NOTE: the connection is only referenced while a
+                    #       page is being requested, see _collect_ahead
+                    connection = reference()
+
+                    if connection is None:
+                        return
+
+                    data = await connection._collect_page(kwargs)
+                    kwargs["cursor"] = data["pageInfo"][cursor_name]
+
+                    del connection
+
+                nodes = data["nodes"]
+
+                if not first_ids[index].done():
+                    first_ids[index].set_result(nodes[0]["id"] if nodes else None)
+
+                if boundary is MISSING:
+                    boundary = None
+
+                    for future in first_ids[index + 1:]:
+                        boundary = await future
+
+                        if boundary is not None:
+                            break
+
+                if boundary is not None:
+                    for (i, node) in enumerate(nodes):
+                        if node["id"] == boundary:
+                            await queue.put(nodes[:i])
+                            await queue.put(None)
+                            return
+
+                await queue.put(nodes)
+
+                if not data["pageInfo"]["hasNextPage"]:
+                    await queue.put(None)
+                    return
+
+                data = None
+        except Exception as e:
+            await queue.put(e)
+        finally:
+            if not first_ids[index].done():
+                first_ids[index].set_result(None)
+
+    async def _anext_streamed(
+        self: Self,
+        /,
+    ) -> _Tci:
+        while True:
+            if self._stream_task is None:
+                if self._done:
+                    raise StopAsyncIteration
+
+                if self._limit is not None:
+                    self._kwargs["length"] = max(DEFAULT_MINIMUM_NODES, min(self._limit, self._length or DEFAULT_MAXIMUM_NODES))
+
+                # NOTE: holds a single node, such that the response is
+                #       read no faster than its nodes are consumed
+                self._stream_queue = asyncio.Queue(1)
+                self._stream_task = asyncio.ensure_future(self._collect_streamed(weakref.ref(self), self._stream_queue, self._collector, self._args, self._kwargs))
+
+                self._pages.append([self._next_cursor, 0, 0])
 
             if TYPE_CHECKING:
-                self._length = cast(int, self._length)
+                assert self._stream_queue is not None
 
-            if len(staged_nodes) > self._length:
-                self._buffer = staged_nodes[self._length:]
+            node = await self._stream_queue.get()
 
-            return staged_nodes[:self._length]  # type: ignore  # NOTE: this is magic, see Connection.paginate
+            if node is _STREAM_END:
+                self._stream_task = None
+                self._pages.clear()
+                continue
 
-        self._buffer = staged_nodes
+            if isinstance(node, BaseException):
+                self._stream_task = None
+                raise node
 
-        if self._limit is not None:
-            self._limit -= 1
+            if self._compiled_stages is None:
+                self._compiled_stages = self._compile_stages()
+
+            staged_nodes = await self._stage_page([node])
+
+            if not staged_nodes:
+                continue
+
+            self._pages[0][1] += 1
+
+            if self._skip:
+                # NOTE: an item yielded before the checkpoint this
+                #       connection was restored from
+                self._skip -= 1
+                continue
+
+            if self._limit is not None:
+                self._limit -= 1
+
+            return staged_nodes[0]
+
+    @staticmethod
+    async def _collect_streamed(
+        reference: weakref.ref[Connection[Any]],
+        queue: asyncio.Queue[Any],
+        collector: Callable[..., Awaitable[ConnectionData[Any]]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        /,
+    ) -> None:
+        # NOTE: the connection is not referenced while the response is
+        #       read, see _collect_ahead
+        try:
+            data = await collector(*args, _data_stream=queue.put, **kwargs)
+        except Exception as e:
+            await queue.put(e)
+            return
+
+        # NOTE: a collector which does not support streaming returns
+        #       its nodes as usual
+        for node in data["nodes"]:
+            await queue.put(node)
+
+        connection = reference()
+
+        if connection is None:
+            return
+
+        cursor_name = "startCursor" if kwargs["reverse"] else "endCursor"
+        page_name = "hasPreviousPage" if kwargs["reverse"] else "hasNextPage"
+
+        connection._kwargs["cursor"] = connection._next_cursor = data["pageInfo"][cursor_name]
+        connection._done = not data["pageInfo"][page_name]
+
+        del connection
+
+        await queue.put(_STREAM_END)
+
+    def _cancel_tasks(
+        self: Self,
+        /,
+    ) -> None:
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            self._prefetch_task = None
+
+        for task in self._split_tasks:
+            task.cancel()
+
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            self._stream_task = None
+
+        self._split_tasks.clear()
+
+    async def aclose(
+        self: Self,
+        /,
+    ) -> None:
+        """
+        |coro|
+
+        Stops iteration and cancels any requests in flight, such as
+        those made by :meth:`prefetch`, :meth:`split`, and
+        :meth:`stream`.
+
+        This is called when the connection is used as an asynchronous
+        context manager, and should be called when you stop iterating
+        before the connection is exhausted. Otherwise, the requests
+        are cancelled once the connection is garbage collected.
+
+        .. code:: python
+
+            async with client.fetch_stargazers(...).prefetch() as stargazers:
+                async for stargazer in stargazers:
+                    if ...:
+                        break
+        """
+
+        tasks = [t for t in (self._prefetch_task, self._stream_task, *self._split_tasks) if t is not None]
+
+        self._cancel_tasks()
+        self._closed = True
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def adaptive(
+        self: Self,
+        /,
+        *,
+        minimum: int = MISSING,
+        maximum: int = MISSING,
+        latency: float = MISSING,
+    ) -> Self:
+        """
+        Adapts the number of items requested per page to the responses
+        of the API.
+
+        The page length grows while responses arrive within
+        ``latency``, halves when responses take more than twice as
+        long, and halves before retrying a page which failed with a
+        :exc:`~github.core.errors.ClientResponseGraphQLMaximumNodeLimitExceededError`
+        or a timeout. A page which times out is not retried by the
+        :class:`~github.RetryPolicy` of the client, such that it halves
+        on the first timeout. Each change is logged to the
+        ``github.connections.connection`` :mod:`logger <logging>` at the
+        ``DEBUG`` level.
+
+        .. note::
+
+            A client with a :class:`~github.RateLimiter` also shrinks
+            pages whose estimated cost exceeds the remaining rate limit
+            budget.
+
+
+        Parameters
+        ----------
+        minimum: :class:`int`
+            The minimum number of items per page. Defaults to ``10``.
+        maximum: :class:`int`
+            The maximum number of items per page. Defaults to ``100``.
+        latency: :class:`float`
+            The number of seconds within which a response is considered
+            fast. Defaults to ``1.0``.
+
+
+        :rtype: TODO
+        """
+
+        if self._locked:
+            raise RuntimeError("cannot update while iterating")
+
+        minimum = minimum if minimum is not MISSING else DEFAULT_MINIMUM_NODES
+        maximum = maximum if maximum is not MISSING else MAXIMUM_PAGE_NODES
+
+        if not 1 <= minimum <= maximum <= MAXIMUM_PAGE_NODES:
+            raise ValueError(f"minimum and maximum must satisfy 1 <= minimum <= maximum <= {MAXIMUM_PAGE_NODES}")
+
+        self._adaptive = (minimum, maximum, latency if latency is not MISSING else DEFAULT_LATENCY)
+        self._page_length = max(minimum, min(maximum, self._page_length))
+
+        return self
+
+    def checkpoint(
+        self: Self,
+        /,
+    ) -> bytes:
+        """
+        Creates a checkpoint from which iteration can be resumed, see
+        :meth:`from_checkpoint`.
+
+        The checkpoint records the position of the first item which has
+        not been yielded, the remaining limit, and the direction of the
+        connection. It does not record stages, see
+        :meth:`from_checkpoint`.
+
+
+        Raises
+        ------
+
+        RuntimeError
+            The connection is split, see :meth:`split`.
+
+
+        :rtype: :class:`bytes`
+        """
+
+        if self._split > 1:
+            raise RuntimeError("cannot checkpoint a split connection")
+
+        if self._pages:
+            cursor, skip, _ = self._pages[0]
+        else:
+            cursor, skip = self._next_cursor, 0
+
+        def encode(value: Any, /) -> Any:
+            if isinstance(value, type):
+                return {"__type__": value.__name__}
+            elif isinstance(value, (list, tuple)):
+                return [encode(v) for v in value]
+            else:
+                return value
+
+        kwargs = {k: encode(v) for (k, v) in self._kwargs.items() if k not in ("cursor", "length")}
+
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "collector": self._collector.__name__,
+            "args": encode(self._args),
+            "kwargs": kwargs,
+            "cursor": cursor,
+            "data_type": self._data_type.__name__ if self._data_type is not None else None,
+            "done": self._done and not self._pages,
+            "length": self._length,
+            "limit": self._limit,
+            "skip": skip,
+        }
+
+        return json.dumps(checkpoint, separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def from_checkpoint(
+        cls: type[Self],
+        client: Client,
+        checkpoint: bytes,
+        /,
+    ) -> Self:
+        """
+        Restores a connection from a checkpoint created with
+        :meth:`checkpoint`, possibly in another process.
+
+        Stages are not restored. You should apply the same stages as
+        the original connection, such that the items yielded before the
+        checkpoint are skipped correctly.
+
+
+        Parameters
+        ----------
+        client: :class:`~github.Client`
+            The client with which to resume iteration.
+        checkpoint: :class:`bytes`
+            The checkpoint.
+
+
+        Raises
+        ------
+
+        ValueError
+            The checkpoint is invalid or was created by an incompatible
+            version of the library, or names a collector or type which
+            cannot be restored.
+
+
+        :rtype: :class:`~github.connections.Connection`
+        """
+
+        try:
+            data = json.loads(checkpoint)
+        except ValueError:
+            raise ValueError("invalid checkpoint") from None
+
+        if not isinstance(data, dict) or data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError("invalid checkpoint version")
+
+        # NOTE: the checkpoint is untrusted, so only collectors and data
+        #       types are resolved from it, never arbitrary attributes
+        def decode_type(name: Any, /) -> type[Type]:
+            value = getattr(github, name, None) if isinstance(name, str) else None
+
+            if not (isinstance(value, type) and issubclass(value, github.Type)):
+                raise ValueError(f"invalid checkpoint type {name!r}")
+
+            return value
+
+        def decode(value: Any, /) -> Any:
+            if isinstance(value, dict) and value.keys() == {"__type__"}:
+                return decode_type(value["__type__"])
+            elif isinstance(value, list):
+                return [decode(v) for v in value]
+            else:
+                return value
+
+        try:
+            collector_name = data["collector"]
+
+            if not isinstance(collector_name, str) or not collector_name.startswith("collect_") or not callable(getattr(type(client._http), collector_name, None)):
+                raise ValueError(f"invalid checkpoint collector {collector_name!r}")
+
+            if not isinstance(data["kwargs"], dict) or any(not isinstance(k, str) or k.startswith("_") for k in data["kwargs"].keys()):
+                raise ValueError("invalid checkpoint arguments")
+
+            if not isinstance(data["done"], bool) or not isinstance(data["skip"], int):
+                raise ValueError("invalid checkpoint position")
 
-        return self._buffer.pop(0)
+            collector = getattr(client._http, collector_name)
+            data_type = decode_type(data["data_type"]) if data["data_type"] is not None else None
+
+            connection = cls(
+                collector,
+                *decode(data["args"]),
+                data_type=data_type,
+                length=data["length"],
+                limit=data["limit"],
+                cursor=data["cursor"],
+                **{k: decode(v) for (k, v) in data["kwargs"].items()},
+            )
+        except (AttributeError, KeyError, TypeError):
+            raise ValueError("invalid checkpoint") from None
+
+        connection._done = data["done"]
+        connection._skip = data["skip"]
+
+        return connection
 
     def filter(
         self: Self,
@@ -227,7 +1129,7 @@ class Connection(AsyncIterator[_Tci]):
         if self._locked:
             raise RuntimeError("cannot update while iterating")
 
-        self._stages.append(("filter", function))
+        self._stages.append(("filter", function, None, True))
 
         return self
 
@@ -250,6 +1152,9 @@ class Connection(AsyncIterator[_Tci]):
         self: Self,
         function: Callable[[_Tci], _T | Awaitable[_T]],
         /,
+        *,
+        concurrency: int | None = MISSING,
+        ordered: bool = MISSING,
     ) -> Connection[_T]:
         """
         This is similar to the built-in :func:`map <py:map>` function.
@@ -259,6 +1164,15 @@ class Connection(AsyncIterator[_Tci]):
         ----------
         function
             The mapping function.
+        concurrency: Optional[:class:`int`]
+            The maximum number of calls to run at once. When provided,
+            the function is called for each item of a page
+            concurrently. Defaults to ``None``, which calls the
+            function for one item at a time.
+        ordered: :class:`bool`
+            Whether concurrent calls yield items in their original
+            order, rather than as the calls complete. Items are never
+            reordered across pages. Defaults to ``True``.
 
 
         :rtype: TODO
@@ -267,7 +1181,12 @@ class Connection(AsyncIterator[_Tci]):
         if self._locked:
             raise RuntimeError("cannot update while iterating")
 
-        self._stages.append(("map", function))
+        concurrency = concurrency if concurrency is not MISSING else None
+
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be None or a positive integer")
+
+        self._stages.append(("map", function, concurrency, ordered if ordered is not MISSING else True))
 
         return self  # type: ignore  # NOTE: this is magic, see note on ConnectionIterator._stages above
 
@@ -288,6 +1207,111 @@ class Connection(AsyncIterator[_Tci]):
 
         return self  # type: ignore  # NOTE: this is magic, see note on PaginatedConnectionIterator below
 
+    def prefetch(
+        self: Self,
+        /,
+        depth: int = MISSING,
+    ) -> Self:
+        """
+        Requests pages ahead of iteration, such that the next page is
+        in flight while the current page is consumed.
+
+
+        Parameters
+        ----------
+        depth: :class:`int`
+            The maximum number of pages to hold ahead of iteration.
+            Defaults to ``1``.
+
+
+        :rtype: TODO
+        """
+
+        if self._locked:
+            raise RuntimeError("cannot update while iterating")
+
+        depth = depth if depth is not MISSING else 1
+
+        if depth < 0:
+            raise ValueError("depth must be a non-negative integer")
+
+        self._prefetch = depth
+
+        return self
+
+    def stream(
+        self: Self,
+        /,
+    ) -> Self:
+        """
+        Decodes the items of each page one at a time as the response
+        arrives, rather than once the whole page has arrived, such that
+        the first item of a page is yielded sooner and at most one item
+        is held in memory at a time.
+
+        Streamed requests are not retried, see
+        :class:`~github.RetryPolicy`, and streaming does not apply to
+        :meth:`paginate`, :meth:`prefetch`, or :meth:`split`.
+
+
+        :rtype: TODO
+        """
+
+        if self._locked:
+            raise RuntimeError("cannot update while iterating")
+
+        self._stream = True
+
+        return self
+
+    def split(
+        self: Self,
+        /,
+        count: int,
+    ) -> Self:
+        """
+        Splits the connection into several ranges which are requested
+        concurrently, rather than following one cursor page by page.
+        Items are still yielded in order.
+
+        The ranges are computed from the order key encoded in the
+        cursors of the first and last items. This supports connections
+        ordered by database ID, and connections ordered by a timestamp,
+        such as :meth:`~github.Starrable.fetch_stargazers`, which is
+        ordered by the time of each star. Other
+        connections are iterated sequentially, and a warning is logged
+        to the ``github.connections.connection`` logger.
+
+        .. note::
+
+            Each range is requested as fast as possible, and its pages
+            are held until iteration reaches them. Use
+            :meth:`prefetch` to limit the number of pages held per
+            range.
+
+
+        Parameters
+        ----------
+        count: :class:`int`
+            The maximum number of ranges.
+
+
+        :rtype: TODO
+        """
+
+        if self._locked:
+            raise RuntimeError("cannot update while iterating")
+
+        if count < 1:
+            raise ValueError("count must be a positive integer")
+
+        if self._kwargs["reverse"]:
+            raise ValueError("cannot split a reversed connection")
+
+        self._split = count
+
+        return self
+
 
 if TYPE_CHECKING:
 
@@ -298,7 +1322,11 @@ if TYPE_CHECKING:
     class PaginatedConnection(AsyncIterator[_Tci]):
         def filter(self: Self, function: Callable[[_Tci], bool | Awaitable[bool]], /) -> Self: ...
         async def flatten(self: Self, /) -> list[_Tci]: ...
-        def map(self: Self, function: Callable[[_Tci], _T | Awaitable[_T]], /) -> PaginatedConnection[_T]: ...
+        def map(self: Self, function: Callable[[_Tci], _T | Awaitable[_T]], /, *, concurrency: int | None = ..., ordered: bool = ...) -> PaginatedConnection[_T]: ...
+        def adaptive(self: Self, /, *, minimum: int = ..., maximum: int = ..., latency: float = ...) -> Self: ...
+        def prefetch(self: Self, /, depth: int = ...) -> Self: ...
+        def split(self: Self, /, count: int) -> Self: ...
+        def stream(self: Self, /) -> Self: ...
 
 
 __all__: Final[list[str]] = [
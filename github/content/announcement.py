@@ -5,7 +5,7 @@ if TYPE_CHECKING:
     from typing_extensions import Self, cast
 
     from github.core.http import HTTPClient
-    from github.utility.types import T_json_key, T_json_value, DateTime
+    from github.utility.types import T_json_key, T_json_object, T_json_value, DateTime
 
 import github
 from github.core.errors import ClientObjectMissingFieldError
@@ -121,6 +121,20 @@ class Announcement(Type):
         *,
         save: bool = MISSING,
     ) -> T_json_value:
+        data = await self._fetch_fields(field, save=save)
+        value = data[github.utility.get_graphql_key(field)]
+
+        if TYPE_CHECKING:
+            value = cast(T_json_value, value)
+
+        return value
+
+    async def _fetch_fields(
+        self: Self,
+        /,
+        *fields: T_json_key,
+        save: bool = MISSING,
+    ) -> T_json_object:
         save = save if save is not MISSING else True
 
         try:
@@ -128,14 +142,12 @@ class Announcement(Type):
         except KeyError:
             raise ClientObjectMissingFieldError from None
 
-        data = await self._http.fetch_query_node(self.__class__, id, fields=(field,))
-
-        value = data[field]
+        data = await self._http.coalesce(self._http.fetch_query_node, self.__class__, id, fields=fields)
 
         if save:
-            self._data[field] = value
+            self._data.update(data)  # type: ignore
 
-        return value
+        return data
 
     async def fetch_can_viewer_dismiss(
         self: Self,
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing_extensions import Self
 
-    from github.utility.types import T_json_key, T_json_value
+    from github.utility.types import T_json_key, T_json_object
 
 from github.core.errors import ClientObjectMissingFieldError
 from github.interfaces import Node, Resource, Type
@@ -121,13 +121,12 @@ class CodeOfConduct(Node, Resource, Type):
 
         return super().url
 
-    async def _fetch_field(
+    async def _fetch_fields(
         self: Self,
-        field: T_json_key,
         /,
-        *,
+        *fields: T_json_key,
         save: bool = MISSING,
-    ) -> T_json_value:
+    ) -> T_json_object:
         save = save if save is not MISSING else True
 
         try:
@@ -149,9 +148,9 @@ class CodeOfConduct(Node, Resource, Type):
             raise ClientObjectMissingFieldError("id", "key", "url") from None
 
         if id is not False:
-            data = await self._http.fetch_query_node(self.__class__, id, fields=(field,))
+            data = await self._http.coalesce(self._http.fetch_query_node, self.__class__, id, fields=fields)
         elif key and key != "other" and not url:
-            data = await self._http.fetch_query_code_of_conduct(key, fields=(field,))
+            data = await self._http.coalesce(self._http.fetch_query_code_of_conduct, key, fields=fields)
         elif url:
             raise NotImplementedError  # TODO: custom code of conduct
         elif not url:
@@ -159,12 +158,10 @@ class CodeOfConduct(Node, Resource, Type):
         elif not key:
             raise ClientObjectMissingFieldError("id", "key") from None
 
-        value = data[field]
-
         if save:
-            self._data[field] = value
+            self._data.update(data)  # type: ignore
 
-        return value
+        return data
 
     async def fetch_body(
         self: Self,
@@ -216,7 +213,7 @@ class CodeOfConduct(Node, Resource, Type):
         :rtype: :class:`str`
         """
 
-        return await super().fetch_id()  # type: ignore
+        return await super().fetch_id()
 
     async def fetch_key(
         self: Self,
@@ -294,7 +291,7 @@ class CodeOfConduct(Node, Resource, Type):
         :rtype: Optional[:class:`str`]
         """
 
-        return await super().fetch_resource_path()  # type: ignore
+        return await super().fetch_resource_path()
 
     async def fetch_url(
         self: Self,
@@ -320,7 +317,7 @@ class CodeOfConduct(Node, Resource, Type):
         :rtype: Optional[:class:`str`]
         """
 
-        return await super().fetch_url()  # type: ignore
+        return await super().fetch_url()
 
 
 __all__: list[str] = [
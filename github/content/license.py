@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from typing_extensions import Self
 
-    from github.utility.types import T_json_key, T_json_value
+    from github.utility.types import T_json_key, T_json_object
 
 from github import utility
 from github.core.errors import ClientObjectMissingFieldError
@@ -262,13 +262,12 @@ class License(Node, Type):
 
         return self._data["spdxId"]
 
-    async def _fetch_field(
+    async def _fetch_fields(
         self: Self,
-        field: T_json_key,
         /,
-        *,
+        *fields: T_json_key,
         save: bool = MISSING,
-    ) -> T_json_value:
+    ) -> T_json_object:
         save = save if save is not MISSING else True
 
         try:
@@ -285,20 +284,18 @@ class License(Node, Type):
             raise ClientObjectMissingFieldError("id", "key") from None
 
         if id is not False:
-            data = await self._http.fetch_query_node(self.__class__, id, fields=(field,))
+            data = await self._http.coalesce(self._http.fetch_query_node, self.__class__, id, fields=fields)
         elif key and key != "other":
-            data = await self._http.fetch_query_license(key, fields=(field,))
+            data = await self._http.coalesce(self._http.fetch_query_license, key, fields=fields)
         elif key is False:
             raise ClientObjectMissingFieldError("key") from None
         else:
             raise ClientObjectMissingFieldError("id") from None
 
-        value = data[field]
-
         if save:
-            self._data[field] = value
+            self._data.update(data)  # type: ignore
 
-        return value
+        return data
 
     async def fetch_body(
         self: Self,
@@ -423,7 +420,7 @@ class License(Node, Type):
         :rtype: :class:`str`
         """
 
-        return await super().fetch_id()  # type: ignore
+        return await super().fetch_id()
 
     async def fetch_implementation(
         self: Self,
@@ -1,10 +1,28 @@
+from github.core.catalogcache import *
+from github.core.catalogcache import __all__ as _catalogcache__all__
 from github.core.client import *
 from github.core.client import __all__ as _client__all__
 from github.core.errors import *
 from github.core.errors import __all__ as _errors__all__
+from github.core.jsoncodec import *
+from github.core.jsoncodec import __all__ as _jsoncodec__all__
+from github.core.persistedqueryregistry import *
+from github.core.persistedqueryregistry import __all__ as _persistedqueryregistry__all__
+from github.core.ratelimiter import *
+from github.core.ratelimiter import __all__ as _ratelimiter__all__
+from github.core.responsecache import *
+from github.core.responsecache import __all__ as _responsecache__all__
+from github.core.retrypolicy import *
+from github.core.retrypolicy import __all__ as _retrypolicy__all__
 
 
 __all__: list[str] = [  # type: ignore[reportUnsupportedDunderAll]
+    *_catalogcache__all__,
     *_client__all__,
     *_errors__all__,
+    *_jsoncodec__all__,
+    *_persistedqueryregistry__all__,
+    *_ratelimiter__all__,
+    *_responsecache__all__,
+    *_retrypolicy__all__,
 ]
@@ -0,0 +1,272 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable
+    from typing_extensions import Self
+
+    from github.utility.types import T_json_object
+
+import json
+import sqlite3
+import threading
+import time
+
+import github
+from github.utility import MISSING
+
+
+DEFAULT_TTL: float = 86400.0
+SCHEMA_VERSION: int = 2
+
+
+class CatalogCache:
+    """
+    Caches the catalogs of licenses and codes of conduct on disk.
+
+    The catalogs are stored in an SQLite database, such that several
+    processes can share them. The body of each license and code of
+    conduct is only read from the database when it is accessed.
+
+    The methods of this class block and are safe to call from other
+    threads, the client calls :meth:`get` and :meth:`set` in an
+    executor.
+
+    Catalogs fetched by a different version of the library are
+    considered stale.
+
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path to the database. It is created when it does not exist.
+
+    ttl: :class:`float`
+        The number of seconds to cache a catalog for. Defaults to a
+        day.
+    """
+
+    __slots__ = ("path", "ttl", "_connection", "_lock")
+
+    def __init__(
+        self: Self,
+        path: str,
+        /,
+        *,
+        ttl: float = MISSING,
+    ) -> None:
+        self.path: str = path
+        self.ttl: float = ttl if ttl is not MISSING else DEFAULT_TTL
+
+        self._connection: sqlite3.Connection | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def _connect(
+        self: Self,
+        /,
+    ) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+
+        (version,) = connection.execute("PRAGMA user_version").fetchone()
+
+        if version != SCHEMA_VERSION:
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("DROP TABLE IF EXISTS catalogs")
+                connection.execute("DROP TABLE IF EXISTS entries")
+                connection.execute("CREATE TABLE catalogs (name TEXT NOT NULL, fields TEXT NOT NULL, version TEXT NOT NULL, fetched_at REAL NOT NULL, PRIMARY KEY (name, fields))")
+                connection.execute("CREATE TABLE entries (name TEXT NOT NULL, fields TEXT NOT NULL, key TEXT NOT NULL, position INTEGER NOT NULL, data TEXT NOT NULL, body TEXT, PRIMARY KEY (name, fields, key))")
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        self._connection = connection
+
+        return connection
+
+    @staticmethod
+    def _get_fields_key(
+        fields: Iterable[str],
+        /,
+    ) -> str:
+        return ",".join(sorted(fields)) if fields is not MISSING else ""
+
+    @staticmethod
+    def _get_item_key(
+        item: T_json_object,
+        position: int,
+        /,
+    ) -> str:
+        # NOTE: falls back to the position of the item when neither key
+        #       nor id were fetched
+        key = item.get("key") or item.get("id")
+
+        return str(key) if key is not None else f"#{position}"
+
+    def get(
+        self: Self,
+        name: str,
+        /,
+        fields: Iterable[str] = MISSING,
+    ) -> list[T_json_object] | None:
+        """
+        Gets a cached catalog, without the body of each item.
+
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the catalog, ``"licenses"`` or
+            ``"codesOfConduct"``.
+        fields: Iterable[:class:`str`]
+            The fields the catalog was fetched with.
+
+
+        :rtype: Optional[List[:class:`dict`]]
+        """
+
+        fields_key = self._get_fields_key(fields)
+
+        with self._lock:
+            connection = self._connect()
+
+            row = connection.execute("SELECT version, fetched_at FROM catalogs WHERE name = ? AND fields = ?", (name, fields_key)).fetchone()
+
+            if row is None or row[0] != github.version or row[1] + self.ttl <= time.time():
+                return None
+
+            rows = connection.execute("SELECT data FROM entries WHERE name = ? AND fields = ? ORDER BY position", (name, fields_key)).fetchall()
+
+        return [json.loads(data) for (data,) in rows]
+
+    def get_body(
+        self: Self,
+        name: str,
+        key: str,
+        /,
+        fields: Iterable[str] = MISSING,
+    ) -> str | None:
+        """
+        Gets the body of an item in a cached catalog.
+
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the catalog.
+        key: :class:`str`
+            The key of the item, its ``key`` or ``id`` field.
+        fields: Iterable[:class:`str`]
+            The fields the catalog was fetched with.
+
+
+        :rtype: Optional[:class:`str`]
+        """
+
+        with self._lock:
+            row = self._connect().execute("SELECT body FROM entries WHERE name = ? AND fields = ? AND key = ?", (name, self._get_fields_key(fields), key)).fetchone()
+
+        return row[0] if row is not None else None
+
+    def has_body(
+        self: Self,
+        name: str,
+        /,
+        fields: Iterable[str] = MISSING,
+    ) -> bool:
+        """
+        Whether the items of a cached catalog have a body.
+
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the catalog.
+        fields: Iterable[:class:`str`]
+            The fields the catalog was fetched with.
+
+
+        :rtype: :class:`bool`
+        """
+
+        with self._lock:
+            row = self._connect().execute("SELECT 1 FROM entries WHERE name = ? AND fields = ? AND body IS NOT NULL LIMIT 1", (name, self._get_fields_key(fields))).fetchone()
+
+        return row is not None
+
+    def set(
+        self: Self,
+        name: str,
+        data: Iterable[T_json_object],
+        /,
+        fields: Iterable[str] = MISSING,
+    ) -> None:
+        """
+        Caches a catalog.
+
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the catalog.
+        data: Iterable[:class:`dict`]
+            The items of the catalog.
+        fields: Iterable[:class:`str`]
+            The fields the catalog was fetched with.
+        """
+
+        fields_key = self._get_fields_key(fields)
+
+        rows = list()
+
+        for (position, item) in enumerate(data):
+            key = self._get_item_key(item, position)
+
+            item = dict(item)
+            body = item.pop("body", None)
+
+            rows.append((name, fields_key, key, position, json.dumps(item), body))
+
+        with self._lock:
+            connection = self._connect()
+
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("DELETE FROM entries WHERE name = ? AND fields = ?", (name, fields_key))
+                connection.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+                connection.execute("INSERT OR REPLACE INTO catalogs VALUES (?, ?, ?, ?)", (name, fields_key, github.version, time.time()))
+
+    def clear(
+        self: Self,
+        /,
+    ) -> None:
+        """
+        Invalidates all cached catalogs.
+        """
+
+        with self._lock:
+            connection = self._connect()
+
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("DELETE FROM catalogs")
+                connection.execute("DELETE FROM entries")
+
+    def close(
+        self: Self,
+        /,
+    ) -> None:
+        """
+        Closes the database.
+        """
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+__all__: list[str] = [
+    "CatalogCache",
+]
@@ -2,14 +2,27 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Any, Awaitable, Callable, Iterable, TypeVar
     from typing_extensions import Self
 
     from aiohttp import ClientSession
 
+    from github.core.catalogcache import CatalogCache
+    from github.core.jsoncodec import JSONCodec
+    from github.core.persistedqueryregistry import PersistedQueryRegistry
+    from github.core.ratelimiter import RateLimiter
+    from github.core.responsecache import ResponseCache
+    from github.core.retrypolicy import RetryPolicy
     from github.organization import Organization
     from github.user import UserStatus
+    from github.utility import LRUCache
     from github.utility.types import DateTime, T_json_object
 
+    _T = TypeVar("_T", CodeOfConduct, License)
+
+import asyncio
+import functools
+
 import graphql
 
 import github
@@ -29,8 +42,19 @@ class Client(graphql.client.Client):
     Parameters
     ----------
 
-    token: :class:`str`
-        A GitHub personal access token.
+    token: Union[:class:`str`, Iterable[:class:`str`]]
+        A GitHub personal access token, or several tokens to pool.
+
+        When given several tokens, the client sends each query with the
+        next token in turn, or with the token that has the most rate
+        limit budget remaining when given a ``rate_limiter``, and sends
+        each mutation, and each query which depends on the
+        authenticated user, such as :meth:`fetch_viewer`, with the first
+        token. Fields which depend on the authenticated user, such as
+        :attr:`User.is_viewer <github.User.is_viewer>`, are not
+        requested by default. Fetching one, such as with
+        :meth:`User.fetch_is_viewer <github.User.fetch_is_viewer>`,
+        sends the query with the first token.
 
         .. seealso::
 
@@ -50,6 +74,74 @@ class Client(graphql.client.Client):
             allow them to contact you should there be a problem. Using
             ``USERNAME; ShineyDev/github@{version}:{uuid}``, replacing
             USERNAME with your username, would suffice for both.
+
+    batch_window: Optional[:class:`float`]
+        The number of seconds to collect node fetches for before
+        sending them as a single request. ``0`` collects node fetches
+        issued within the same iteration of the event loop. Defaults
+        to ``None``, which sends each node fetch as its own request.
+
+    batch_size: :class:`int`
+        The maximum number of node fetches to send in a single
+        request. Defaults to ``50``.
+
+    catalog_cache: Optional[:class:`~github.CatalogCache`]
+        An on-disk cache for the catalogs of licenses and codes of
+        conduct, see :meth:`fetch_all_licenses` and
+        :meth:`fetch_all_codes_of_conduct`. Defaults to ``None``, which
+        fetches the catalogs each time.
+
+    identity_map: :class:`bool`
+        Whether to create one object per node. When enabled, the
+        client returns the object it created for a node before, if
+        that object is still referenced, and updates it with the
+        fields of the new response, rather than creating another.
+        Defaults to ``False``.
+
+    json_codec: Optional[:class:`~github.JSONCodec`]
+        A JSON codec to encode requests and decode responses with, such
+        as :meth:`JSONCodec.fastest() <github.JSONCodec.fastest>` to use
+        orjson or ujson when installed. Defaults to ``None``, which uses
+        the standard library.
+
+    persisted_queries: Optional[:class:`~github.PersistedQueryRegistry`]
+        A registry of persisted queries. When provided, the client
+        sends the hash of each document known to the server in place
+        of the document. Defaults to ``None``, which sends each
+        document in full.
+
+        .. note::
+
+            GitHub's GraphQL API does not support persisted queries.
+            This is intended for use with a proxy which does, see
+            ``url``.
+
+    rate_limiter: Optional[:class:`~github.RateLimiter`]
+        A rate limiter, such as a :class:`~github.RateLimiter` with no
+        reserve. Defaults to ``None``, which does not limit requests,
+        such that requests which exceed the rate limit fail.
+
+    response_cache: Optional[:class:`~github.ResponseCache`]
+        A response cache. When provided, the client answers queries for
+        reference data, such as :meth:`fetch_all_licenses`, from the
+        cache while their responses are fresh, and sends concurrent
+        identical queries as one request. Defaults to ``None``, which
+        sends each query.
+
+    retry_policy: Optional[:class:`~github.RetryPolicy`]
+        A retry policy, such as a :class:`~github.RetryPolicy` with
+        three attempts. Defaults to ``None``, which does not retry, such
+        that requests which fail due to transient faults fail
+        immediately.
+
+        .. note::
+
+            Each page of a connection is its own request, so a retry
+            resumes iteration from the page which failed.
+
+    url: :class:`str`
+        The URL of the GraphQL API. Defaults to
+        ``https://api.github.com/graphql``.
     """
 
     __slots__ = ()
@@ -57,12 +149,117 @@ class Client(graphql.client.Client):
     def __init__(
         self: Self,
         /,
-        token: str,
+        token: str | Iterable[str],
         *,
         session: ClientSession,
         user_agent: str = MISSING,
+        batch_size: int = MISSING,
+        batch_window: float | None = MISSING,
+        catalog_cache: CatalogCache | None = MISSING,
+        identity_map: bool = MISSING,
+        json_codec: JSONCodec | None = MISSING,
+        persisted_queries: PersistedQueryRegistry | None = MISSING,
+        rate_limiter: RateLimiter | None = MISSING,
+        response_cache: ResponseCache | None = MISSING,
+        retry_policy: RetryPolicy | None = MISSING,
+        url: str = MISSING,
     ) -> None:
-        self._http: HTTPClient = HTTPClient(token, session, user_agent)
+        self._http: HTTPClient = HTTPClient(
+            token,
+            session,
+            user_agent,
+            batch_size=batch_size,
+            batch_window=batch_window,
+            catalog_cache=catalog_cache,
+            identity_map=identity_map,
+            json_codec=json_codec,
+            persisted_queries=persisted_queries,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            retry_policy=retry_policy,
+            url=url,
+        )
+
+    @property
+    def catalog_cache(
+        self: Self,
+        /,
+    ) -> CatalogCache | None:
+        """
+        The catalog cache of the client.
+
+        :type: Optional[:class:`~github.CatalogCache`]
+        """
+
+        return self._http.catalog_cache
+
+    @property
+    def document_cache(
+        self: Self,
+        /,
+    ) -> LRUCache[tuple[Any, ...], str]:
+        """
+        The cache of GraphQL documents built by the client, keyed by
+        the template, type, and requested fields of each document.
+
+        Its ``hits`` and ``misses`` attributes count lookups.
+
+        :type: :class:`~github.utility.LRUCache`
+        """
+
+        return self._http.document_cache
+
+    @property
+    def json_codec(
+        self: Self,
+        /,
+    ) -> JSONCodec | None:
+        """
+        The JSON codec of the client.
+
+        :type: Optional[:class:`~github.JSONCodec`]
+        """
+
+        return self._http.json_codec
+
+    @property
+    def rate_limiter(
+        self: Self,
+        /,
+    ) -> RateLimiter | None:
+        """
+        The rate limiter of the client.
+
+        :type: Optional[:class:`~github.RateLimiter`]
+        """
+
+        return self._http.rate_limiter
+
+    @property
+    def response_cache(
+        self: Self,
+        /,
+    ) -> ResponseCache | None:
+        """
+        The response cache of the client.
+
+        :type: Optional[:class:`~github.ResponseCache`]
+        """
+
+        return self._http.response_cache
+
+    @property
+    def retry_policy(
+        self: Self,
+        /,
+    ) -> RetryPolicy | None:
+        """
+        The retry policy of the client.
+
+        :type: Optional[:class:`~github.RetryPolicy`]
+        """
+
+        return self._http.retry_policy
 
     async def request(
         self: Self,
@@ -131,6 +328,44 @@ class Client(graphql.client.Client):
 
         return await super().request(document, operation, **variables)
 
+    async def _fetch_catalog(
+        self: Self,
+        name: str,
+        type: type[_T],
+        function: Callable[..., Awaitable[Any]],
+        /,
+        **kwargs,  # TODO
+    ) -> list[_T]:
+        cache = self._http.catalog_cache
+
+        if cache is None:
+            return type._from_data(await function(**kwargs), http=self._http)
+
+        fields = kwargs.get("fields", MISSING)
+
+        # NOTE: fields may be an iterator, which the cache and the
+        #       request must not consume twice
+        if fields is not MISSING:
+            fields = kwargs["fields"] = tuple(fields)
+
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, cache.get, name, fields)
+
+        if data is None:
+            data = await function(**kwargs)
+            await loop.run_in_executor(None, cache.set, name, data, fields)
+
+            return type._from_data(data, http=self._http)
+
+        objects = type._from_data(data, http=self._http)
+
+        if await loop.run_in_executor(None, cache.has_body, name, fields):
+            for (position, (item, object)) in enumerate(zip(data, objects)):
+                key = cache._get_item_key(item, position)
+                object._data.set_lazy("body", functools.partial(cache.get_body, name, key, fields))  # type: ignore
+
+        return objects
+
     async def fetch_all_codes_of_conduct(
         self: Self,
         /,
@@ -152,8 +387,7 @@ class Client(graphql.client.Client):
         :rtype: List[:class:`~github.CodeOfConduct`]
         """
 
-        data = await self._http.fetch_query_all_codes_of_conduct(**kwargs)
-        return CodeOfConduct._from_data(data, http=self._http)
+        return await self._fetch_catalog("codesOfConduct", CodeOfConduct, self._http.fetch_query_all_codes_of_conduct, **kwargs)
 
     async def fetch_all_licenses(
         self: Self,
@@ -176,8 +410,7 @@ class Client(graphql.client.Client):
         :rtype: List[:class:`~github.License`]
         """
 
-        data = await self._http.fetch_query_all_licenses(**kwargs)
-        return License._from_data(data, http=self._http)
+        return await self._fetch_catalog("licenses", License, self._http.fetch_query_all_licenses, **kwargs)
 
     async def fetch_code_of_conduct(
         self: Self,
@@ -212,6 +212,26 @@ class ClientResponseGraphQLNotFoundError(ClientResponseGraphQLError):
     __slots__ = ()
 
 
+class ClientResponseGraphQLRateLimitedError(ClientResponseGraphQLError):
+    """
+    Represents a GraphQL ``"RATE_LIMITED"`` response.
+
+
+    Attributes
+    ----------
+    message: :class:`str`
+        The error message.
+
+    response: :class:`aiohttp.ClientResponse`
+        The client response.
+
+    data: :class:`dict`
+        The response data.
+    """
+
+    __slots__ = ()
+
+
 class ClientResponseGraphQLUnprocessableError(ClientResponseGraphQLError):
     """
     Represents a GraphQL ``"UNPROCESSABLE"`` response.
@@ -265,6 +285,7 @@ _response_error_map: dict[int | str, type[ClientError]] = {
     "INTERNAL": ClientResponseGraphQLInternalError,
     "MAX_NODE_LIMIT_EXCEEDED": ClientResponseGraphQLMaximumNodeLimitExceededError,
     "NOT_FOUND": ClientResponseGraphQLNotFoundError,
+    "RATE_LIMITED": ClientResponseGraphQLRateLimitedError,
     "UNPROCESSABLE": ClientResponseGraphQLUnprocessableError,
     401: ClientResponseHTTPUnauthorizedError,
 }
@@ -291,6 +312,7 @@ __all__: list[str] = [
     "ClientResponseGraphQLInternalError",
     "ClientResponseGraphQLMaximumNodeLimitExceededError",
     "ClientResponseGraphQLNotFoundError",
+    "ClientResponseGraphQLRateLimitedError",
     "ClientResponseGraphQLUnprocessableError",
     "ClientResponseHTTPError",
     "ClientResponseHTTPUnauthorizedError",
@@ -2,10 +2,16 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Any, Iterable, Tuple, cast, overload
+    from typing import Any, Awaitable, Callable, Coroutine, Iterable, Tuple, TypeVar, cast, overload
     from typing_extensions import Self
 
     from aiohttp import ClientResponse, ClientSession
+    from github.core.catalogcache import CatalogCache
+    from github.core.jsoncodec import JSONCodec
+    from github.core.persistedqueryregistry import PersistedQueryRegistry
+    from github.core.ratelimiter import RateLimiter
+    from github.core.responsecache import ResponseCache
+    from github.core.retrypolicy import RetryPolicy
     from github.connection.metadata import MetadataData
     from github.connection.ratelimit import RateLimitData
     from github.connections.connection import ConnectionData
@@ -13,7 +19,7 @@ if TYPE_CHECKING:
     from github.content.announcement import AnnouncementData
     from github.content.codeofconduct import CodeOfConductData
     from github.content.license import LicenseData
-    from github.interfaces import Node, Resource
+    from github.interfaces import Node, Resource, Type
     from github.interfaces.profileowner import ProfileOwnerData
     from github.interfaces.starrable import StarrableData
     from github.interfaces.subscribable import SubscribableData
@@ -25,35 +31,171 @@ if TYPE_CHECKING:
     from github.user.userstatus import UserStatusData
     from github.utility.types import T_json_key, T_json_object, T_json_value
 
+    _T = TypeVar("_T")
+
+import asyncio
+import codecs
+import copy
+import hashlib
+import json
+import re
 import uuid
+import weakref
 
 import graphql
 
 import github
-from github.utility import MISSING
+from github.core.responsecache import _get_root_fields, _is_viewer_dependent
+from github.utility import MISSING, LRUCache
 
 
+DEFAULT_BATCH_SIZE: int = 50
+DEFAULT_DOCUMENT_CACHE_SIZE: int = 1024
 DEFAULT_MAXIMUM_NODES: int = 50
 DEFAULT_MINIMUM_NODES: int = 10
+DEFAULT_RATE_LIMIT_ATTEMPTS: int = 5
+DEFAULT_STREAM_CHUNK_SIZE: int = 65536
+DEFAULT_URL: str = "https://api.github.com/graphql"
+MAXIMUM_PAGE_NODES: int = 100
+
+
+def _get_nested_connection(
+    node: T_json_object,
+    name: str,
+    /,
+) -> ConnectionData[Any]:
+    connection = node[name]
+
+    if TYPE_CHECKING:
+        connection = cast(ConnectionData[Any], connection)
+
+    return connection
+
+
+def _is_mutation(
+    document: str,
+    /,
+) -> bool:
+    return document.lstrip().startswith("mutation")
+
+
+def _is_viewer_template(
+    template: str,
+    /,
+) -> bool:
+    return _is_mutation(template) or "viewer" in _get_root_fields(template)
 
 
 class HTTPClient(graphql.client.http.HTTPClient):
-    __slots__ = ("token", "user_agent", "uuid")
+    __slots__ = (
+        "catalog_cache",
+        "document_cache",
+        "identity_map",
+        "json_codec",
+        "rate_limiter",
+        "response_cache",
+        "retry_policy",
+        "token",
+        "tokens",
+        "user_agent",
+        "uuid",
+        "_batch_handle",
+        "_batch_pending",
+        "_batch_size",
+        "_batch_window",
+        "_coalesce_pending",
+        "_inflight",
+        "_persisted_queries",
+        "_session",
+        "_tasks",
+        "_token_index",
+        "_tokens_digest",
+        "_url",
+    )
 
     def __init__(
         self: Self,
         /,
-        token: str,
+        token: str | Iterable[str],
         session: ClientSession,
         user_agent: str | None,
+        *,
+        batch_size: int = MISSING,
+        batch_window: float | None = MISSING,
+        catalog_cache: CatalogCache | None = MISSING,
+        identity_map: bool = MISSING,
+        json_codec: JSONCodec | None = MISSING,
+        persisted_queries: PersistedQueryRegistry | None = MISSING,
+        rate_limiter: RateLimiter | None = MISSING,
+        response_cache: ResponseCache | None = MISSING,
+        retry_policy: RetryPolicy | None = MISSING,
+        url: str = MISSING,
     ) -> None:
-        super().__init__(session=session, url="https://api.github.com/graphql")
+        url = url if url is not MISSING else DEFAULT_URL
+
+        super().__init__(session=session, url=url)
+
+        self._session: ClientSession = session
+        self._url: str = url
 
         self.uuid = str(uuid.uuid4())
 
-        self.token = f"bearer {token}"
+        tokens = [token] if isinstance(token, str) else list(token)
+
+        if not tokens:
+            raise ValueError("token must be a string or a non-empty iterable of strings")
+
+        self.tokens: tuple[str, ...] = tuple(f"bearer {t}" for t in tokens)
+        self.token: str = self.tokens[0]
+        self._token_index: int = 0
+
+        # NOTE: identifies the tokens in response cache keys, such that
+        #       a cache shared between clients, or persisted, does not
+        #       hold the tokens themselves
+        self._tokens_digest: str = hashlib.sha256("\0".join(self.tokens).encode("utf-8")).hexdigest()
+
         self.user_agent = (user_agent or "ShineyDev/github@{version}:{uuid}").format(uuid=self.uuid, version=github.version)
 
+        batch_size = batch_size if batch_size is not MISSING else DEFAULT_BATCH_SIZE
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        batch_window = batch_window if batch_window is not MISSING else None
+
+        if batch_window is not None and batch_window < 0:
+            raise ValueError("batch_window must be None or a non-negative number")
+
+        self._batch_handle: asyncio.Handle | None = None
+        self._batch_pending: list[tuple[str, str, asyncio.Future[T_json_object]]] = list()
+        self._batch_size: int = batch_size
+        self._batch_window: float | None = batch_window
+
+        self.catalog_cache: CatalogCache | None = catalog_cache if catalog_cache is not MISSING else None
+        self.document_cache: LRUCache[tuple[Any, ...], str] = LRUCache(max_size=DEFAULT_DOCUMENT_CACHE_SIZE)
+
+        # NOTE: maps the ID of each node to the object created for it,
+        #       for as long as the object is referenced elsewhere
+        identity_map = identity_map if identity_map is not MISSING else False
+
+        self.identity_map: weakref.WeakValueDictionary[str, Type] | None = weakref.WeakValueDictionary() if identity_map else None
+
+        self._coalesce_pending: dict[tuple[Any, ...], tuple[list[str], asyncio.Future[T_json_object]]] = dict()
+        self.json_codec: JSONCodec | None = json_codec if json_codec is not MISSING else None
+        self._persisted_queries: PersistedQueryRegistry | None = persisted_queries if persisted_queries is not MISSING else None
+
+        self.rate_limiter: RateLimiter | None = rate_limiter if rate_limiter is not MISSING else None
+        self.retry_policy: RetryPolicy | None = retry_policy if retry_policy is not MISSING else None
+
+        # NOTE: identical queries in flight at once share one request
+        self._inflight: dict[tuple[str, str], tuple[asyncio.Future[T_json_object], list[int], asyncio.Future[None]]] = dict()
+
+        self.response_cache: ResponseCache | None = response_cache if response_cache is not MISSING else None
+
+        # NOTE: holds strong references to background tasks, see the
+        #       note on asyncio.create_task
+        self._tasks: set[asyncio.Future[Any]] = set()
+
     async def request(
         self: Self,
         document_: str,
@@ -65,11 +207,294 @@ class HTTPClient(graphql.client.http.HTTPClient):
         **kwargs,  # TODO
     ) -> T_json_object:
         headers = headers or dict()
-        headers["Authorization"] = self.token
         headers["User-Agent"] = self.user_agent
 
+        if kwargs.get("_data_stream") is not None:
+            return await self._request_sent(document_, operation_, variables_, headers=headers, **kwargs)
+
+        if _is_mutation(document_):
+            data = await self._request_sent(document_, operation_, variables_, headers=headers, **kwargs)
+
+            if self.response_cache is not None:
+                self.response_cache.invalidate(document_, variables_)
+
+            return data
+
+        key = (document_, json.dumps(variables_, separators=(",", ":"), sort_keys=True))
+        ttl = self.response_cache.get_ttl(document_) if self.response_cache is not None else None
+
+        if ttl is not None:
+            if TYPE_CHECKING:
+                assert self.response_cache is not None
+
+            # NOTE: responses are keyed by the tokens of the client, such
+            #       that a cache shared between clients does not leak them
+            data = self.response_cache.get((*key, self._tokens_digest))
+
+            if data is not None:
+                # NOTE: callers patch the data they are given, so each is
+                #       given its own copy of the cached response
+                return copy.deepcopy(data)
+
         try:
-            data = await super().request(document_, operation_, variables_, headers=headers, **kwargs)
+            future, waiters, task = self._inflight[key]
+        except KeyError:
+            future = asyncio.get_running_loop().create_future()
+            task = self._spawn(self._request_shared(key, future, document_, operation_, variables_, ttl, headers=headers, **kwargs))
+            waiters = [0]
+
+            self._inflight[key] = (future, waiters, task)
+
+        waiters[0] += 1
+
+        try:
+            # NOTE: the future is shared with other callers, so one of
+            #       them being cancelled must not cancel it for the rest
+            data = await asyncio.shield(future)
+        finally:
+            waiters[0] -= 1
+
+            if not waiters[0] and not future.done():
+                # NOTE: the last caller was cancelled, so nobody is
+                #       waiting on the request any longer
+                task.cancel()
+
+                if self._inflight.get(key, (None,))[0] is future:
+                    del self._inflight[key]
+
+        # NOTE: callers patch the data they are given, so the last
+        #       caller is given the response and the rest a copy
+        return data if not waiters[0] else copy.deepcopy(data)
+
+    async def _request_shared(
+        self: Self,
+        key: tuple[str, str],
+        future: asyncio.Future[T_json_object],
+        document_: str,
+        operation_: str | None,
+        variables_: T_json_object,
+        ttl: float | None,
+        /,
+        *,
+        headers: dict[str, str],
+        **kwargs,  # TODO
+    ) -> None:
+        try:
+            data = await self._request_sent(document_, operation_, variables_, headers=headers, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if ttl is not None:
+                if TYPE_CHECKING:
+                    assert self.response_cache is not None
+
+                self.response_cache.set((*key, self._tokens_digest), copy.deepcopy(data), ttl, variables=variables_)
+
+            if not future.done():
+                future.set_result(data)
+        finally:
+            if self._inflight.get(key, (None,))[0] is future:
+                del self._inflight[key]
+
+    async def _request_sent(
+        self: Self,
+        document_: str,
+        operation_: str | None,
+        variables_: T_json_object,
+        /,
+        *,
+        headers: dict[str, str],
+        **kwargs,  # TODO
+    ) -> T_json_object:
+        _data_retry_timeout = kwargs.pop("_data_retry_timeout", True)
+
+        # NOTE: a streamed request cannot be retried, as its nodes may
+        #       have been consumed already
+        if self.retry_policy is None or (_is_mutation(document_) and not self.retry_policy.retry_mutations) or kwargs.get("_data_stream") is not None:
+            return await self._request_routed(document_, operation_, variables_, headers=headers, **kwargs)
+
+        return await self._request_retried(document_, operation_, variables_, headers=headers, _data_retry_timeout=_data_retry_timeout, **kwargs)
+
+    async def _request_retried(
+        self: Self,
+        document_: str,
+        operation_: str | None,
+        variables_: T_json_object,
+        /,
+        *,
+        headers: dict[str, str],
+        _data_retry_timeout: bool = True,
+        **kwargs,  # TODO
+    ) -> T_json_object:
+        if TYPE_CHECKING:
+            assert self.retry_policy is not None
+
+        attempt = 1
+
+        while True:
+            try:
+                return await self._request_routed(document_, operation_, variables_, headers=headers, **kwargs)
+            except Exception as e:
+                if not self.retry_policy.is_retryable(e):
+                    raise
+
+                # NOTE: an adaptive connection shrinks its page on the
+                #       first timeout rather than waiting out the
+                #       retries, see Connection.adaptive
+                if not _data_retry_timeout and isinstance(e, asyncio.TimeoutError):
+                    raise
+
+                if attempt >= self.retry_policy.attempts:
+                    self.retry_policy.failures += 1
+                    raise
+
+                delay = self.retry_policy.get_delay(e, attempt)
+
+            self.retry_policy.retries += 1
+            attempt += 1
+
+            await asyncio.sleep(delay)
+
+    async def _request_routed(
+        self: Self,
+        document_: str,
+        operation_: str | None,
+        variables_: T_json_object,
+        /,
+        *,
+        headers: dict[str, str],
+        **kwargs,  # TODO
+    ) -> T_json_object:
+        if self.rate_limiter is None:
+            headers["Authorization"] = self._select_token(document_)
+
+            return await self._request(document_, operation_, variables_, headers=headers, **kwargs)
+
+        return await self._request_limited(document_, operation_, variables_, headers=headers, **kwargs)
+
+    async def _request_limited(
+        self: Self,
+        document_: str,
+        operation_: str | None,
+        variables_: T_json_object,
+        /,
+        *,
+        headers: dict[str, str],
+        _data_validate: Any | None = None,  # TODO
+        **kwargs,  # TODO
+    ) -> T_json_object:
+        if TYPE_CHECKING:
+            assert self.rate_limiter is not None
+
+        response_headers = None
+
+        def validate(
+            response: ClientResponse,
+            data: T_json_object,
+            /,
+        ) -> None:
+            nonlocal response_headers
+            response_headers = response.headers
+
+            if _data_validate is not None:
+                _data_validate(response, data)
+
+        try:
+            cost = github.utility.estimate_cost(document_, variables_).cost
+        except ValueError:
+            cost = 1
+
+        for attempt in range(DEFAULT_RATE_LIMIT_ATTEMPTS):
+            # NOTE: the token is selected on each attempt so that a
+            #       rate limited request moves to another token
+            token = headers["Authorization"] = self._select_token(document_, cost)
+
+            await self.rate_limiter.acquire(cost, key=token)
+
+            response_headers = None
+
+            try:
+                data = await self._request(document_, operation_, variables_, headers=headers, _data_validate=validate, **kwargs)
+            except github.ClientResponseError as e:
+                self.rate_limiter.release(cost, getattr(e.response, "headers", None), key=token)
+
+                delay = self.rate_limiter.get_delay(e, key=token)
+
+                if delay is None or attempt == DEFAULT_RATE_LIMIT_ATTEMPTS - 1:
+                    raise
+
+                if self._select_token(document_, cost) == token:
+                    # NOTE: wait out the rate limit rather than failing
+                    #       when there is no other token to move to
+                    await asyncio.sleep(delay)
+            except BaseException:
+                self.rate_limiter.release(cost, key=token)
+                raise
+            else:
+                self.rate_limiter.release(cost, response_headers, key=token)
+                return data
+
+        raise RuntimeError("exhausted rate limit attempts; this shouldn't happen")
+
+    def _get_pinned_token(
+        self: Self,
+        document_: str,
+        /,
+    ) -> str | None:
+        if len(self.tokens) == 1 or _is_mutation(document_) or _is_viewer_dependent(document_):
+            # NOTE: mutations stick to the primary token so that they
+            #       are attributed to a single actor, and queries which
+            #       select viewer, or a field which depends on the
+            #       viewer, stick to it so that they describe that
+            #       actor. the default fields of other queries leave
+            #       such fields out, see _get_pooled_fields
+            return self.token
+
+        return None
+
+    def _select_token(
+        self: Self,
+        document_: str,
+        cost: int = 1,
+        /,
+    ) -> str:
+        token = self._get_pinned_token(document_)
+
+        if token is not None:
+            return token
+
+        if self.rate_limiter is None:
+            self._token_index = (self._token_index + 1) % len(self.tokens)
+            return self.tokens[self._token_index]
+
+        return self.rate_limiter.select(self.tokens, cost)  # type: ignore
+
+    async def _request(
+        self: Self,
+        document_: str,
+        operation_: str | None,
+        variables_: T_json_object,
+        /,
+        *,
+        headers: dict[str, str],
+        **kwargs,  # TODO
+    ) -> T_json_object:
+        _data_stream = kwargs.pop("_data_stream", None)
+
+        try:
+            if self._persisted_queries is not None:
+                data = await self._request_persisted(document_, operation_, variables_, headers=headers, _data_stream=_data_stream, **kwargs)
+            elif _data_stream is not None or self.json_codec is not None:
+                # NOTE: the underlying client encodes and decodes with
+                #       the standard library
+                payload = {"operationName": operation_ if operation_ is not MISSING else None, "query": document_, "variables": variables_}
+                data = await self._post(payload, headers=headers, _data_stream=_data_stream, **kwargs)
+            else:
+                data = await super().request(document_, operation_, variables_, headers=headers, **kwargs)
         except github.ClientError:
             raise
         except graphql.client.ClientResponseHTTPError as e:
@@ -93,6 +518,151 @@ class HTTPClient(graphql.client.http.HTTPClient):
         else:
             return data
 
+    async def _request_persisted(
+        self: Self,
+        document_: str,
+        operation_: str | None,
+        variables_: T_json_object,
+        /,
+        *,
+        headers: dict[str, str],
+        _data_stream: tuple[str, Callable[[T_json_object], Awaitable[None]]] | None = None,
+        _data_validate: Any | None = None,  # TODO
+    ) -> T_json_object:
+        if TYPE_CHECKING:
+            assert self._persisted_queries is not None
+
+        hash = self._persisted_queries.hash(document_)
+
+        payload = {
+            "extensions": {"persistedQuery": {"sha256Hash": hash, "version": 1}},
+            "operationName": operation_ if operation_ is not MISSING else None,
+            "variables": variables_,
+        }
+
+        if self._persisted_queries.is_known(hash):
+            try:
+                return await self._post(payload, headers=headers, _data_stream=_data_stream, _data_validate=_data_validate)
+            except github.ClientResponseGraphQLError as e:
+                errors = e.data.get("errors") or [dict()]  # type: ignore
+
+                if errors[0].get("message") != "PersistedQueryNotFound" and errors[0].get("extensions", dict()).get("code") != "PERSISTED_QUERY_NOT_FOUND":
+                    raise
+
+                self._persisted_queries.discard(hash)
+
+        # NOTE: sending the document alongside its hash asks the server
+        #       to persist it for subsequent requests
+        payload["query"] = document_
+
+        data = await self._post(payload, headers=headers, _data_stream=_data_stream, _data_validate=_data_validate)
+
+        self._persisted_queries.add(hash)
+
+        return data
+
+    async def _post(
+        self: Self,
+        payload: T_json_object,
+        /,
+        *,
+        headers: dict[str, str],
+        _data_stream: tuple[str, Callable[[T_json_object], Awaitable[None]]] | None = None,
+        _data_validate: Any | None = None,  # TODO
+    ) -> T_json_object:
+        dumps, loads = (self.json_codec.dumps, self.json_codec.loads) if self.json_codec is not None else (json.dumps, json.loads)
+
+        headers = {**headers, "Content-Type": "application/json"}
+
+        data: Any
+
+        async with self._session.post(self._url, data=dumps(payload), headers=headers) as response:
+            try:
+                if _data_stream is not None and response.status < 400:
+                    data = await self._read_stream(response, *_data_stream, loads)
+                else:
+                    body = await response.read()
+                    data = loads(body) if body.strip() else None
+            except ValueError:
+                data = None
+
+            if data and data.get("errors"):
+                error = data["errors"][0]
+                exc_type = github.core.errors._response_error_map.get(error.get("type"), github.ClientResponseGraphQLError)
+
+                raise exc_type(error.get("message", "unknown error"), response, data)
+
+            if response.status >= 400 or data is None:
+                exc_type = github.core.errors._response_error_map.get(response.status, github.ClientResponseHTTPError)
+
+                raise exc_type(f"{response.status} {response.reason}", response, data)
+
+            if _data_validate is not None:
+                _data_validate(response, data)
+
+            return data["data"]
+
+    async def _read_stream(
+        self: Self,
+        response: ClientResponse,
+        key: str,
+        callback: Callable[[T_json_object], Awaitable[None]],
+        loads: Callable[[str], Any],
+        /,
+    ) -> T_json_object:
+        # NOTE: decodes the nodes of the connection at key one at a time
+        #       as the body arrives, passing each to the callback rather
+        #       than holding the page in memory. the remainder of the
+        #       body is decoded with an empty nodes list once the nodes
+        #       end. this relies on nodes being the first selection of
+        #       the connection, otherwise the body is decoded in full.
+        #       the nodes are decoded with the standard library, as the
+        #       faster libraries cannot decode a prefix of a document
+        decoder = json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        marker = re.compile(r'(?<!\\)"%s"\s*:\s*\{\s*"nodes"\s*:\s*\[' % re.escape(key))
+
+        buffer = ""
+        prefix = None
+        searched = 0
+        streaming = True
+
+        async for chunk in response.content.iter_chunked(DEFAULT_STREAM_CHUNK_SIZE):
+            buffer += text_decoder.decode(chunk)
+
+            if prefix is None:
+                match = marker.search(buffer, max(searched - len(key) - 16, 0))
+                searched = len(buffer)
+
+                if match is None:
+                    continue
+
+                prefix, buffer = buffer[:match.end()], buffer[match.end():]
+
+            while streaming:
+                buffer = buffer.lstrip(" \t\n\r,")
+
+                if not buffer:
+                    break
+
+                if buffer[0] == "]":
+                    streaming = False
+                    break
+
+                try:
+                    node, end = decoder.raw_decode(buffer)
+                except ValueError:
+                    # NOTE: the node is incomplete
+                    break
+
+                buffer = buffer[end:]
+
+                await callback(node)
+
+        buffer += text_decoder.decode(b"", True)
+
+        return loads((prefix or "") + buffer)
+
     def _patch_organizationdata(
         self: Self,
         data: OrganizationData,
@@ -136,17 +706,206 @@ class HTTPClient(graphql.client.http.HTTPClient):
 
         return data
 
+    def _document(
+        self: Self,
+        template: str,
+        type: type[Type],
+        fields: Iterable[str],
+        /,
+        *required: str,
+    ) -> str:
+        if fields is not MISSING:
+            fields = tuple(fields)
+
+        key = (template, type, fields, required)
+
+        try:
+            return self.document_cache[key]
+        except KeyError:
+            pass
+
+        if fields is MISSING and not _is_viewer_template(template):
+            merged_fields = self._get_pooled_fields(type)
+        else:
+            merged_fields = github.utility.get_merged_graphql_fields(type, fields)
+
+        for field in required:
+            if field not in merged_fields:
+                merged_fields.append(field)
+
+        document = template % {"fields": ",".join(merged_fields), "type": github.utility.get_graphql_type(type)}
+        self.document_cache[key] = document
+
+        return document
+
+    def _get_pooled_fields(
+        self: Self,
+        type: type[Type],
+        /,
+    ) -> list[str]:
+        fields = github.utility.get_merged_graphql_fields(type)
+
+        if len(self.tokens) > 1:
+            # NOTE: a query is sent with whichever token in the pool has
+            #       the most points available, so the fields which
+            #       depend on the viewer would describe an arbitrary
+            #       token. they are left out of the default fields, and
+            #       a query which requests one explicitly is sent with
+            #       the primary token, see _get_pinned_token
+            fields = [f for f in fields if not _is_viewer_dependent(f)]
+
+        return fields
+
     async def _fetch(
         self: Self,
         document_: str,
         /,
         *path: T_json_key,
+        _data_retry_timeout: bool = True,
+        _data_stream: tuple[str, Callable[[T_json_object], Awaitable[None]]] | None = None,
         _data_validate: Any | None = None,  # TODO
         **kwargs,  # TODO
     ) -> T_json_value:
-        data = await self.request(document_, None, kwargs, _data_validate=_data_validate)
+        data = await self.request(document_, None, kwargs, _data_retry_timeout=_data_retry_timeout, _data_stream=_data_stream, _data_validate=_data_validate)
         return github.utility.follow(data, path)
 
+    def _spawn(
+        self: Self,
+        coroutine: Coroutine[Any, Any, _T],
+        /,
+    ) -> asyncio.Future[_T]:
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        return task
+
+    async def coalesce(
+        self: Self,
+        function: Callable[..., Awaitable[T_json_object]],
+        /,
+        *args: Any,
+        fields: Iterable[str],
+    ) -> T_json_object:
+        key = (function, *args)
+
+        try:
+            pending_fields, future = self._coalesce_pending[key]
+        except KeyError:
+            pending_fields, future = list(), asyncio.get_running_loop().create_future()
+            self._coalesce_pending[key] = (pending_fields, future)
+            self._spawn(self._coalesce_send(key))
+
+        for field in fields:
+            if field not in pending_fields:
+                pending_fields.append(field)
+
+        # NOTE: the future is shared with other callers, so one of them
+        #       being cancelled must not cancel it for the rest
+        return await asyncio.shield(future)
+
+    async def _coalesce_send(
+        self: Self,
+        key: tuple[Any, ...],
+        /,
+    ) -> None:
+        # NOTE: yield once so that every fetch for the same object
+        #       issued within the current iteration of the event loop
+        #       can join this one
+        await asyncio.sleep(0)
+
+        fields, future = self._coalesce_pending.pop(key)
+        function, *args = key
+
+        try:
+            data = await function(*args, fields=fields)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(data)
+
+    async def _batch(
+        self: Self,
+        selection: str,
+        id: str,
+        /,
+    ) -> T_json_object:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        self._batch_pending.append((selection, id, future))
+
+        if len(self._batch_pending) >= self._batch_size:
+            self._batch_flush()
+        elif self._batch_handle is None:
+            if self._batch_window:
+                self._batch_handle = loop.call_later(self._batch_window, self._batch_flush)
+            else:
+                # NOTE: a zero window collects every node requested
+                #       within the current iteration of the event loop
+                self._batch_handle = loop.call_soon(self._batch_flush)
+
+        return await future
+
+    def _batch_flush(
+        self: Self,
+        /,
+    ) -> None:
+        if self._batch_handle is not None:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+
+        entries, self._batch_pending = self._batch_pending, list()
+
+        if entries:
+            self._spawn(self._batch_send(entries))
+
+    async def _batch_send(
+        self: Self,
+        entries: list[tuple[str, str, asyncio.Future[T_json_object]]],
+        /,
+    ) -> None:
+        arguments = ",".join(f"$id{i}:ID!" for i in range(len(entries)))
+        selections = ",".join(f"node{i}:node(id:$id{i}){{{selection}}}" for (i, (selection, _, _)) in enumerate(entries))
+        document = "query(%s){%s}" % (arguments, selections)
+
+        variables = {f"id{i}": id for (i, (_, id, _)) in enumerate(entries)}
+
+        try:
+            # NOTE: the variables are passed as a mapping rather than as
+            #       keyword arguments to _fetch, where they could collide
+            #       with its own parameters
+            data = await self.request(document, None, variables)
+        except github.ClientResponseGraphQLError as e:
+            if len(entries) > 1:
+                # NOTE: a single bad node fails the entire document, so
+                #       we retry each node on its own to isolate the
+                #       error to its caller
+                await asyncio.gather(*[self._batch_send([entry]) for entry in entries])
+                return
+
+            for (_, _, future) in entries:
+                if not future.done():
+                    future.set_exception(e)
+        except asyncio.CancelledError:
+            for (_, _, future) in entries:
+                future.cancel()
+
+            raise
+        except Exception as e:
+            for (_, _, future) in entries:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (i, (_, _, future)) in enumerate(entries):
+                if not future.done():
+                    future.set_result(data[f"node{i}"])  # type: ignore
+
     async def fetch_announcementowner_announcement(
         self: Self,
         /,
@@ -154,8 +913,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> AnnouncementData | None:
-        fields = github.utility.get_merged_graphql_fields(github.Announcement, fields)
-        query = "query($announcementowner_id: ID!){node(id:$announcementowner_id){...on AnnouncementBanner{%s}}}" % ",".join(fields)
+        query = self._document("query($announcementowner_id: ID!){node(id:$announcementowner_id){...on AnnouncementBanner{%(fields)s}}}", github.Announcement, fields)
         path = ("node",)
 
         data = await self._fetch(query, *path, announcementowner_id=announcementowner_id)
@@ -174,8 +932,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> tuple[CodeOfConductData, ...]:
-        fields = github.utility.get_merged_graphql_fields(github.CodeOfConduct, fields)
-        query = "{codesOfConduct{%s}}" % ",".join(fields)
+        query = self._document("{codesOfConduct{%(fields)s}}", github.CodeOfConduct, fields)
         path = ("codesOfConduct",)
 
         def validate(
@@ -202,8 +959,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> tuple[LicenseData, ...]:
-        fields = github.utility.get_merged_graphql_fields(github.License, fields)
-        query = "{licenses{%s}}" % ",".join(fields)
+        query = self._document("{licenses{%(fields)s}}", github.License, fields)
         path = ("licenses",)
 
         def validate(
@@ -231,8 +987,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> CodeOfConductData:
-        fields = github.utility.get_merged_graphql_fields(github.CodeOfConduct, fields)
-        query = "query($key:String!){codeOfConduct(key:$key){%s}}" % ",".join(fields)
+        query = self._document("query($key:String!){codeOfConduct(key:$key){%(fields)s}}", github.CodeOfConduct, fields)
         path = ("codeOfConduct",)
 
         def validate(
@@ -271,8 +1026,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> LicenseData:
-        fields = github.utility.get_merged_graphql_fields(github.License, fields)
-        query = "query($key:String!){license(key:$key){%s}}" % ",".join(fields)
+        query = self._document("query($key:String!){license(key:$key){%(fields)s}}", github.License, fields)
         path = ("license",)
 
         def validate(
@@ -310,8 +1064,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> MetadataData:
-        fields = github.utility.get_merged_graphql_fields(github.Metadata, fields)
-        query = "{meta{%s}}" % ",".join(fields)
+        query = self._document("{meta{%(fields)s}}", github.Metadata, fields)
         path = ("meta",)
 
         value = await self._fetch(query, *path)
@@ -378,11 +1131,15 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> T_json_object:
-        fields = github.utility.get_merged_graphql_fields(type, fields)
-        query = "query($id:ID!){node(id:$id){...on %s{%s}}}" % (github.utility.get_graphql_type(type), ",".join(fields))
-        path = ("node",)
+        if self._batch_window is not None:
+            selection = self._document("...on %(type)s{%(fields)s}", type, fields)
 
-        value = await self._fetch(query, *path, id=id)
+            value = await self._batch(selection, id)
+        else:
+            query = self._document("query($id:ID!){node(id:$id){...on %(type)s{%(fields)s}}}", type, fields)
+            path = ("node",)
+
+            value = await self._fetch(query, *path, id=id)
 
         if TYPE_CHECKING:
             value = cast(T_json_object, value)
@@ -398,8 +1155,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> OrganizationData:
-        fields = github.utility.get_merged_graphql_fields(github.Organization, fields)
-        query = "query($login:String!){organization(login:$login){%s}}" % ",".join(fields)
+        query = self._document("query($login:String!){organization(login:$login){%(fields)s}}", github.Organization, fields)
         path = ("organization",)
 
         data = await self._fetch(query, *path, login=login)
@@ -420,8 +1176,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> RateLimitData:
-        fields = github.utility.get_merged_graphql_fields(github.RateLimit, fields)
-        query = "{rateLimit(dryRun:true){%s}}" % ",".join(fields)
+        query = self._document("{rateLimit(dryRun:true){%(fields)s}}", github.RateLimit, fields)
         path = ("rateLimit",)
 
         value = await self._fetch(query, *path)
@@ -458,8 +1213,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> T_json_object:
-        fields = github.utility.get_merged_graphql_fields(type, fields)
-        query = "query($url:URI!){resource(url:$url){...on %s{%s}}}" % (github.utility.get_graphql_type(type), ",".join(fields))
+        query = self._document("query($url:URI!){resource(url:$url){...on %(type)s{%(fields)s}}}", type, fields)
         path = ("resource",)
 
         value = await self._fetch(query, *path, url=url)
@@ -478,8 +1232,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> TopicData:
-        fields = github.utility.get_merged_graphql_fields(github.Topic, fields)
-        query = "query($name:String!){topic(name:$name){%s}}" % ",".join(fields)
+        query = self._document("query($name:String!){topic(name:$name){%(fields)s}}", github.Topic, fields)
         path = ("topic",)
 
         def validate(
@@ -512,13 +1265,8 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> UserData:
-        fields = github.utility.get_merged_graphql_fields(github.User, fields)
-
-        # NOTE: this holds together the hack in User._from_data
-        if "isViewer" not in fields:
-            fields.append("isViewer")
-
-        query = "query($login:String!){user(login:$login){%s}}" % ",".join(fields)
+        # NOTE: isViewer holds together the hack in User._from_data
+        query = self._document("query($login:String!){user(login:$login){%(fields)s}}", github.User, fields, "isViewer")
         path = ("user",)
 
         value = await self._fetch(query, *path, login=login)
@@ -538,8 +1286,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> UserData:
-        fields = github.utility.get_merged_graphql_fields(github.User, fields)
-        query = "query{viewer{%s}}" % ",".join(fields)
+        query = self._document("query{viewer{%(fields)s}}", github.User, fields)
         path = ("viewer",)
 
         value = await self._fetch(query, *path)
@@ -562,8 +1309,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> tuple[TopicData, ...]:
-        fields = github.utility.get_merged_graphql_fields(github.Topic, fields)
-        query = "query($topic_id:ID!,$limit:Int){node(id:$topic_id){...on Topic{relatedTopics(first:$limit){%s}}}}" % ",".join(fields)
+        query = self._document("query($topic_id:ID!,$limit:Int){node(id:$topic_id){...on Topic{relatedTopics(first:$limit){%(fields)s}}}}", github.Topic, fields)
         path = ("node", "relatedTopics")
 
         value = await self._fetch(query, *path, limit=limit, topic_id=topic_id)
@@ -577,8 +1323,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> UserStatusData:
-        fields = github.utility.get_merged_graphql_fields(github.UserStatus, fields)
-        query = "query($user_id:ID!){node(id:$user_id){...on User{status{%s}}}}" % ",".join(fields)
+        query = self._document("query($user_id:ID!){node(id:$user_id){...on User{status{%(fields)s}}}}", github.UserStatus, fields)
         path = ("node", "status")
 
         value = await self._fetch(query, *path, user_id=user_id)
@@ -592,8 +1337,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> OrganizationData | None:
-        fields = github.utility.get_merged_graphql_fields(github.User, fields)
-        query = "query($userstatus_id:ID!){node(id:$userstatus_id){...on UserStatus{organization{%s}}}}" % ",".join(fields)
+        query = self._document("query($userstatus_id:ID!){node(id:$userstatus_id){...on UserStatus{organization{%(fields)s}}}}", github.User, fields)
         path = ("node", "organization")
 
         data = await self._fetch(query, *path, userstatus_id=userstatus_id)
@@ -615,13 +1359,8 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> UserData:
-        fields = github.utility.get_merged_graphql_fields(github.User, fields)
-
-        # NOTE: this holds together the hack in User._from_data
-        if "isViewer" not in fields:
-            fields.append("isViewer")
-
-        query = "query($userstatus_id:ID!){node(id:$userstatus_id){...on UserStatus{user{%s}}}}" % ",".join(fields)
+        # NOTE: isViewer holds together the hack in User._from_data
+        query = self._document("query($userstatus_id:ID!){node(id:$userstatus_id){...on UserStatus{user{%(fields)s}}}}", github.User, fields, "isViewer")
         path = ("node", "user")
 
         data = await self._fetch(query, *path, userstatus_id=userstatus_id)
@@ -633,11 +1372,164 @@ class HTTPClient(graphql.client.http.HTTPClient):
 
         return data
 
+    def _fit_page_size(
+        self: Self,
+        document_: str,
+        length: int,
+        direction_name: str,
+        variables_: T_json_object,
+        /,
+    ) -> int:
+        # NOTE: shrinks the page until the document fits under the
+        #       node limit and the remaining rate limit budget, rather
+        #       than failing with MAX_NODE_LIMIT_EXCEEDED or waiting on
+        #       the rate limit reset
+        if self.rate_limiter is not None and self.rate_limiter.remaining is not None:
+            token = self._get_pinned_token(document_)
+
+            # NOTE: a pooled query is sent with the token with the most
+            #       points available, see RateLimiter.select
+            if token is not None:
+                budget = self.rate_limiter.get_available(token)
+            else:
+                budget = max(self.rate_limiter.get_available(t) for t in self.tokens)
+        else:
+            budget = None
+
+        while length > 1:
+            try:
+                estimate = github.utility.estimate_cost(document_, {**variables_, direction_name: length})
+            except ValueError:
+                break
+
+            if estimate.node_count <= github.utility.MAXIMUM_NODE_LIMIT and (budget is None or estimate.cost <= max(budget, 1)):
+                break
+
+            length //= 2
+
+        return length
+
+    def _nested_selection(
+        self: Self,
+        name: str,
+        type: type[Type],
+        length: int | None,
+        /,
+        after: str | None = None,
+    ) -> str:
+        fields = ",".join(self._get_pooled_fields(type))
+
+        if length is None:
+            return "%s{%s}" % (name, fields)
+
+        arguments = "first:%d" % length
+
+        if after is not None:
+            arguments += ",after:%s" % after
+
+        return "%s(%s){totalCount,nodes{%s},pageInfo{endCursor,hasNextPage}}" % (name, arguments, fields)
+
+    def _nested_fields(
+        self: Self,
+        type: type[Type],
+        fields: Iterable[str],
+        nested: tuple[tuple[str, type[Type], int | None], ...],
+        /,
+    ) -> tuple[Iterable[str], list[str]]:
+        # NOTE: (name, type, length) selects an object when length is
+        #       None, and otherwise the first length items of a
+        #       connection, such that the nested data arrives in the
+        #       same document as its parent. items past the first page
+        #       are continued by _collect_nested
+        if not nested:
+            return fields, []
+
+        names = {name for (name, _, _) in nested}
+
+        # NOTE: the nested selection replaces any selection of the same
+        #       field, e.g. followers{totalCount}, with which it would
+        #       otherwise conflict
+        fields = self._get_pooled_fields(type) if fields is MISSING else github.utility.get_merged_graphql_fields(type, fields)
+        fields = [f for f in fields if github.utility.get_graphql_key(f) not in names]
+        required = ["id", *(self._nested_selection(name, type_, min(length, MAXIMUM_PAGE_NODES) if length is not None else None) for (name, type_, length) in nested)]
+
+        return fields, required
+
+    async def _collect_nested(
+        self: Self,
+        type: type[Type],
+        nodes: list[T_json_object],
+        nested: tuple[tuple[str, type[Type], int | None], ...],
+        /,
+    ) -> None:
+        # NOTE: continues only the nested connections which have more
+        #       pages and fewer than length items, batching follow-ups
+        #       across parents rather than making a request per parent
+        pending: list[tuple[T_json_object, str, type[Type], int]] = list()
+
+        for node in nodes:
+            for (name, type_, length) in nested:
+                if length is None:
+                    continue
+
+                connection = _get_nested_connection(node, name)
+
+                if connection["pageInfo"]["hasNextPage"] and len(connection["nodes"]) < length:
+                    pending.append((node, name, type_, length))
+
+        graphql_type = github.utility.get_graphql_type(type)
+
+        while pending:
+            entries, pending = pending[:self._batch_size], pending[self._batch_size:]
+
+            arguments = ",".join(f"$id{i}:ID!,$after{i}:String" for i in range(len(entries)))
+            selections = list()
+            variables = dict()
+
+            for (i, (node, name, type_, length)) in enumerate(entries):
+                connection = _get_nested_connection(node, name)
+                page_length = min(length - len(connection["nodes"]), MAXIMUM_PAGE_NODES)
+
+                selections.append(f"node{i}:node(id:$id{i}){{...on {graphql_type}{{{self._nested_selection(name, type_, page_length, f'$after{i}')}}}}}")
+                variables[f"id{i}"] = node["id"]
+                variables[f"after{i}"] = connection["pageInfo"]["endCursor"]
+
+            document = "query(%s){%s}" % (arguments, ",".join(selections))
+            data = await self.request(document, None, variables)
+
+            for (i, entry) in enumerate(entries):
+                (node, name, _, length) = entry
+                connection = _get_nested_connection(node, name)
+                page = _get_nested_connection(data[f"node{i}"], name)  # type: ignore
+
+                connection["nodes"].extend(page["nodes"])
+                connection["pageInfo"] = page["pageInfo"]
+
+                if page["pageInfo"]["hasNextPage"] and len(connection["nodes"]) < length:
+                    pending.append(entry)
+
+        # NOTE: the nested users are patched as though they were
+        #       fetched directly
+        for node in nodes:
+            for (name, type_, length) in nested:
+                if type_ is not github.User or node.get(name) is None:
+                    continue
+
+                users = _get_nested_connection(node, name)["nodes"] if length is not None else [node[name]]
+
+                for user in users:
+                    if TYPE_CHECKING:
+                        user = cast(UserData, user)
+
+                    self._patch_userdata(user)
+
     async def _collect(
         self: Self,
         document_: str,
         /,
         *path: T_json_key,
+        _data_retry_timeout: bool = True,
+        _data_stream: Callable[[T_json_object], Awaitable[None]] | None = None,
         _data_validate: Any | None = None,  # TODO
         cursor: str | None,
         length: int | None,
@@ -647,10 +1539,16 @@ class HTTPClient(graphql.client.http.HTTPClient):
         direction_name = "last" if reverse else "first"
         position_name = "before" if reverse else "after"
 
-        kwargs[direction_name] = length if length is not None else DEFAULT_MAXIMUM_NODES
+        kwargs[direction_name] = self._fit_page_size(document_, length if length is not None else DEFAULT_MAXIMUM_NODES, direction_name, kwargs)
         kwargs[position_name] = cursor
 
-        data = await self._fetch(document_, *path, _data_validate=_data_validate, **kwargs)
+        if _data_stream is not None and not reverse:
+            # NOTE: the nodes are passed to _data_stream as they arrive
+            #       and the returned page holds none, see
+            #       HTTPClient._read_stream
+            data = await self._fetch(document_, *path, _data_retry_timeout=_data_retry_timeout, _data_stream=(str(path[-1]), _data_stream), _data_validate=_data_validate, **kwargs)
+        else:
+            data = await self._fetch(document_, *path, _data_retry_timeout=_data_retry_timeout, _data_validate=_data_validate, **kwargs)
 
         if TYPE_CHECKING:
             data = cast(ConnectionData[Any], data)
@@ -666,8 +1564,24 @@ class HTTPClient(graphql.client.http.HTTPClient):
             except KeyError:
                 pass
 
+            if _data_stream is not None:
+                # NOTE: a reversed page cannot be streamed, as its nodes
+                #       arrive in the opposite order
+                await self._stream_nodes(data, _data_stream)
+
         return data
 
+    async def _stream_nodes(
+        self: Self,
+        data: ConnectionData[Any],
+        callback: Callable[[T_json_object], Awaitable[None]],
+        /,
+    ) -> None:
+        nodes, data["nodes"] = data["nodes"], []
+
+        for node in nodes:
+            await callback(node)
+
     async def collect_starrable_stargazers(
         self: Self,
         /,
@@ -675,10 +1589,15 @@ class HTTPClient(graphql.client.http.HTTPClient):
         order_by: str | None,
         *,
         fields: Iterable[str] = MISSING,
+        nested: Iterable[tuple[str, type[Type], int | None]] = MISSING,
+        _data_stream: Callable[[T_json_object], Awaitable[None]] | None = None,
         **kwargs,
     ) -> ConnectionData[UserData]:
-        fields = github.utility.get_merged_graphql_fields(github.User, fields)
-        query = "query($after:String,$before:String,$first:Int,$last:Int,$order_by:StarOrder,$starrable_id:ID!){node(id:$starrable_id){...on Starrable{stargazers(after:$after,before:$before,first:$first,last:$last,orderBy:$order_by){nodes{%s},pageInfo{endCursor,hasNextPage,hasPreviousPage,startCursor}}}}}" % ",".join(fields)
+        nested = tuple(nested) if nested is not MISSING else ()
+        nested_connections = any(length is not None for (_, _, length) in nested)
+        fields, required = self._nested_fields(github.User, fields, nested)
+
+        query = self._document("query($after:String,$before:String,$first:Int,$last:Int,$order_by:StarOrder,$starrable_id:ID!){node(id:$starrable_id){...on Starrable{stargazers(after:$after,before:$before,first:$first,last:$last,orderBy:$order_by){nodes{%(fields)s},pageInfo{endCursor,hasNextPage,hasPreviousPage,startCursor}}}}}", github.User, fields, *required)
         path = ("node", "stargazers")
 
         if order_by is None:
@@ -686,7 +1605,19 @@ class HTTPClient(graphql.client.http.HTTPClient):
         else:
             order_by_data = {"direction": "ASC", "field": order_by}
 
-        return await self._collect(query, *path, starrable_id=starrable_id, order_by=order_by_data, **kwargs)
+        if nested_connections:
+            # NOTE: the nested connections are continued once the page
+            #       has arrived, so the page is streamed afterward
+            data = await self._collect(query, *path, starrable_id=starrable_id, order_by=order_by_data, **kwargs)
+
+            await self._collect_nested(github.User, data["nodes"], nested)
+
+            if _data_stream is not None:
+                await self._stream_nodes(data, _data_stream)
+        else:
+            data = await self._collect(query, *path, _data_stream=_data_stream, starrable_id=starrable_id, order_by=order_by_data, **kwargs)
+
+        return data
 
     async def _mutate(
         self: Self,
@@ -708,8 +1639,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> StarrableData:
-        fields = github.utility.get_merged_graphql_fields(github.Starrable, fields)
-        query = "mutation($starrable_id:ID!,$mutation_id:String!){addStar(input:{clientMutationId:$mutation_id,starrableId:$starrable_id}){starrable{%s}}}" % ",".join(fields)
+        query = self._document("mutation($starrable_id:ID!,$mutation_id:String!){addStar(input:{clientMutationId:$mutation_id,starrableId:$starrable_id}){starrable{%(fields)s}}}", github.Starrable, fields)
         path = ("addStar", "starrable")
 
         value = await self._mutate(query, *path, starrable_id=starrable_id)
@@ -723,8 +1653,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> StarrableData:
-        fields = github.utility.get_merged_graphql_fields(github.Starrable, fields)
-        query = "mutation($starrable_id:ID!,$mutation_id:String!){removeStar(input:{clientMutationId:$mutation_id,starrableId:$starrable_id}){starrable{%s}}}" % ",".join(fields)
+        query = self._document("mutation($starrable_id:ID!,$mutation_id:String!){removeStar(input:{clientMutationId:$mutation_id,starrableId:$starrable_id}){starrable{%(fields)s}}}", github.Starrable, fields)
         path = ("removeStar", "starrable")
 
         value = await self._mutate(query, *path, starrable_id=starrable_id)
@@ -739,8 +1668,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> SubscribableData:
-        fields = github.utility.get_merged_graphql_fields(github.Subscribable, fields)
-        query = "mutation($subscribable_id:ID!,$mutation_id:String!,$state:SubscriptionState!){updateSubscription(input:{clientMutationId:$mutation_id,subscribableId:$subscribable_id,state:$state}){subscribable{%s}}}" % ",".join(fields)
+        query = self._document("mutation($subscribable_id:ID!,$mutation_id:String!,$state:SubscriptionState!){updateSubscription(input:{clientMutationId:$mutation_id,subscribableId:$subscribable_id,state:$state}){subscribable{%(fields)s}}}", github.Subscribable, fields)
         path = ("updateSubscription", "subscribable")
 
         value = await self._mutate(query, *path, starrable_id=subscribable_id, state=state)
@@ -758,8 +1686,7 @@ class HTTPClient(graphql.client.http.HTTPClient):
         *,
         fields: Iterable[str] = MISSING,
     ) -> UserStatusData | None:
-        fields = github.utility.get_merged_graphql_fields(github.UserStatus, fields)
-        query = "mutation($busy:Boolean,$emoji:String,$expires_at:DateTime,$message:String,$mutation_id:String!,$organization_id:ID){changeUserStatus(input:{clientMutationId:$mutation_id,emoji:$emoji,expiresAt:$expires_at,limitedAvailability:$busy,message:$message,organizationId:$organization_id}){status{%s}}}" % ",".join(fields)
+        query = self._document("mutation($busy:Boolean,$emoji:String,$expires_at:DateTime,$message:String,$mutation_id:String!,$organization_id:ID){changeUserStatus(input:{clientMutationId:$mutation_id,emoji:$emoji,expiresAt:$expires_at,limitedAvailability:$busy,message:$message,organizationId:$organization_id}){status{%(fields)s}}}", github.UserStatus, fields)
         path = ("changeUserStatus", "status")
 
         value = await self._mutate(query, *path, busy=busy, emoji=emoji, expires_at=expires_at, message=message, organization_id=organization_id)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable
+    from typing_extensions import Self
+
+import importlib
+
+from github.utility import MISSING
+
+
+FAST_MODULES: tuple[str, ...] = ("orjson", "ujson")
+
+
+class JSONCodec:
+    """
+    Encodes request payloads and decodes response bodies.
+
+
+    Parameters
+    ----------
+    dumps: Callable[[Any], Union[:class:`str`, :class:`bytes`]]
+        A function which encodes an object to JSON.
+
+    loads: Callable[[Union[:class:`str`, :class:`bytes`]], Any]
+        A function which decodes JSON to an object. It must accept
+        :class:`bytes` and raise :exc:`ValueError`, or a subclass, on
+        invalid JSON.
+
+    name: :class:`str`
+        The name of the codec. Defaults to the module of ``loads``.
+
+
+    Attributes
+    ----------
+    name: :class:`str`
+        The name of the codec.
+    """
+
+    __slots__ = ("dumps", "loads", "name")
+
+    def __init__(
+        self: Self,
+        /,
+        dumps: Callable[[Any], str | bytes],
+        loads: Callable[[str | bytes], Any],
+        *,
+        name: str = MISSING,
+    ) -> None:
+        self.dumps: Callable[[Any], str | bytes] = dumps
+        self.loads: Callable[[str | bytes], Any] = loads
+        self.name: str = name if name is not MISSING else getattr(loads, "__module__", None) or "unknown"
+
+    def __repr__(
+        self: Self,
+        /,
+    ) -> str:
+        return f"<{self.__class__.__name__} name={self.name!r}>"
+
+    @classmethod
+    def from_module(
+        cls: type[Self],
+        name: str,
+        /,
+    ) -> Self:
+        """
+        Creates a codec from the ``dumps`` and ``loads`` functions of a
+        module, such as ``"orjson"``, ``"ujson"``, or ``"json"``.
+
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the module.
+
+
+        Raises
+        ------
+        ~ImportError
+            The module is not installed.
+
+
+        :rtype: :class:`~github.JSONCodec`
+        """
+
+        module = importlib.import_module(name)
+
+        return cls(module.dumps, module.loads, name=name)
+
+    @classmethod
+    def fastest(
+        cls: type[Self],
+        /,
+    ) -> Self | None:
+        """
+        Creates a codec from the fastest JSON library installed, trying
+        orjson and then ujson.
+
+
+        :rtype: Optional[:class:`~github.JSONCodec`]
+        """
+
+        for name in FAST_MODULES:
+            try:
+                return cls.from_module(name)
+            except ImportError:
+                pass
+
+        return None
+
+
+__all__: list[str] = [
+    "JSONCodec",
+]
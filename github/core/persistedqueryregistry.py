@@ -0,0 +1,131 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+import hashlib
+
+from github.utility import MISSING, LRUCache
+
+
+DEFAULT_HASH_CACHE_SIZE: int = 1024
+
+
+class PersistedQueryRegistry:
+    """
+    Tracks the GraphQL documents a server has persisted.
+
+    When a client is given a registry, it sends the SHA-256 hash of a
+    known document in place of the document itself, and falls back to
+    sending the full document when the server no longer knows it.
+
+    This class stores known hashes in memory. You can subclass it and
+    override :meth:`add`, :meth:`discard`, and :meth:`is_known` to share
+    known hashes between processes.
+
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        The maximum number of document hashes to cache. Defaults to
+        ``1024``.
+    """
+
+    __slots__ = ("_hashes", "_known")
+
+    def __init__(
+        self: Self,
+        /,
+        *,
+        max_size: int = MISSING,
+    ) -> None:
+        self._hashes: LRUCache[str, str] = LRUCache(max_size=max_size if max_size is not MISSING else DEFAULT_HASH_CACHE_SIZE)
+        self._known: set[str] = set()
+
+    def add(
+        self: Self,
+        hash: str,
+        /,
+    ) -> None:
+        """
+        Marks a document hash as known to the server.
+
+
+        Parameters
+        ----------
+        hash: :class:`str`
+            The SHA-256 hash of the document.
+        """
+
+        self._known.add(hash)
+
+    def discard(
+        self: Self,
+        hash: str,
+        /,
+    ) -> None:
+        """
+        Marks a document hash as unknown to the server.
+
+
+        Parameters
+        ----------
+        hash: :class:`str`
+            The SHA-256 hash of the document.
+        """
+
+        self._known.discard(hash)
+
+    def hash(
+        self: Self,
+        document: str,
+        /,
+    ) -> str:
+        """
+        Computes the SHA-256 hash of a document.
+
+
+        Parameters
+        ----------
+        document: :class:`str`
+            The GraphQL document.
+
+
+        :rtype: :class:`str`
+        """
+
+        try:
+            return self._hashes[document]
+        except KeyError:
+            pass
+
+        hash = hashlib.sha256(document.encode("utf-8")).hexdigest()
+        self._hashes[document] = hash
+
+        return hash
+
+    def is_known(
+        self: Self,
+        hash: str,
+        /,
+    ) -> bool:
+        """
+        Whether a document hash is known to the server.
+
+
+        Parameters
+        ----------
+        hash: :class:`str`
+            The SHA-256 hash of the document.
+
+
+        :rtype: :class:`bool`
+        """
+
+        return hash in self._known
+
+
+__all__: list[str] = [
+    "PersistedQueryRegistry",
+]
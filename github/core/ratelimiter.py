@@ -0,0 +1,424 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Hashable, Iterable, Mapping
+    from typing_extensions import Self
+
+import asyncio
+import time
+
+from github.core.errors import ClientResponseError, ClientResponseGraphQLRateLimitedError, ClientResponseHTTPError
+from github.utility import MISSING
+
+
+DEFAULT_LIMIT: int = 5000
+DEFAULT_SECONDARY_DELAY: float = 60.0
+
+
+class _RateLimitState:
+    __slots__ = ("in_flight", "limit", "lock", "remaining", "reserved", "resets_at", "semaphore", "used", "waiting")
+
+    def __init__(
+        self: Self,
+        /,
+        concurrency: int | None,
+    ) -> None:
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.resets_at: float | None = None
+        self.used: int | None = None
+
+        self.in_flight: int = 0
+        self.reserved: int = 0
+        self.waiting: int = 0
+
+        # NOTE: created within the running loop, see _get_state
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.semaphore: asyncio.Semaphore | None = asyncio.Semaphore(concurrency) if concurrency is not None else None
+
+    @property
+    def available(
+        self: Self,
+        /,
+    ) -> int:
+        # NOTE: an unknown budget is assumed to be full
+        remaining = self.remaining if self.remaining is not None else (self.limit or DEFAULT_LIMIT)
+        return remaining - self.reserved
+
+
+class RateLimiter:
+    """
+    Paces requests to stay within the GitHub rate limit.
+
+    The limiter tracks the rate limit state from the headers of each
+    response and holds requests back, rather than sending them to
+    fail, when the remaining points would drop below ``reserve``.
+
+    When the client has several tokens, the limiter tracks the state
+    of each token separately and the attributes below are totals
+    across all tokens.
+
+
+    Parameters
+    ----------
+    reserve: :class:`int`
+        The number of points to leave unused in each rate limit
+        window. Defaults to ``0``.
+
+    concurrency: Optional[:class:`int`]
+        The maximum number of requests to have in flight at once per
+        token. Defaults to ``None``, which does not limit concurrency.
+
+        .. tip::
+
+            GitHub applies secondary rate limits to clients that make
+            many concurrent requests.
+    """
+
+    __slots__ = ("concurrency", "reserve", "_states")
+
+    def __init__(
+        self: Self,
+        /,
+        *,
+        reserve: int = MISSING,
+        concurrency: int | None = MISSING,
+    ) -> None:
+        concurrency = concurrency if concurrency is not MISSING else None
+
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be None or a positive integer")
+
+        self.concurrency: int | None = concurrency
+        self.reserve: int = reserve if reserve is not MISSING else 0
+
+        self._states: dict[Hashable, _RateLimitState] = dict()
+
+    @property
+    def in_flight(
+        self: Self,
+        /,
+    ) -> int:
+        """
+        The number of requests currently in flight.
+
+        :type: :class:`int`
+        """
+
+        return sum(s.in_flight for s in self._states.values())
+
+    @property
+    def limit(
+        self: Self,
+        /,
+    ) -> int | None:
+        """
+        The maximum number of points in a rate limit window, if known.
+
+        :type: Optional[:class:`int`]
+        """
+
+        limits = [s.limit for s in self._states.values() if s.limit is not None]
+        return sum(limits) if limits else None
+
+    @property
+    def queue_depth(
+        self: Self,
+        /,
+    ) -> int:
+        """
+        The number of requests waiting to be sent.
+
+        :type: :class:`int`
+        """
+
+        return sum(s.waiting for s in self._states.values())
+
+    @property
+    def remaining(
+        self: Self,
+        /,
+    ) -> int | None:
+        """
+        The number of points remaining in the current rate limit
+        window, if known.
+
+        :type: Optional[:class:`int`]
+        """
+
+        remaining = [s.remaining for s in self._states.values() if s.remaining is not None]
+        return sum(remaining) if remaining else None
+
+    @property
+    def resets_at(
+        self: Self,
+        /,
+    ) -> float | None:
+        """
+        The POSIX timestamp at which the earliest rate limit window
+        resets, if known.
+
+        :type: Optional[:class:`float`]
+        """
+
+        resets_at = [s.resets_at for s in self._states.values() if s.resets_at is not None]
+        return min(resets_at) if resets_at else None
+
+    @property
+    def used(
+        self: Self,
+        /,
+    ) -> int | None:
+        """
+        The number of points used in the current rate limit window, if
+        known.
+
+        :type: Optional[:class:`int`]
+        """
+
+        used = [s.used for s in self._states.values() if s.used is not None]
+        return sum(used) if used else None
+
+    def _get_state(
+        self: Self,
+        key: Hashable,
+        /,
+    ) -> _RateLimitState:
+        try:
+            return self._states[key]
+        except KeyError:
+            state = self._states[key] = _RateLimitState(self.concurrency)
+            return state
+
+    def get_available(
+        self: Self,
+        key: Hashable = None,
+        /,
+    ) -> int:
+        """
+        Computes the number of points a request can cost without
+        dropping below the reserve.
+
+
+        Parameters
+        ----------
+        key: Hashable
+            The token to compute the available points of.
+
+
+        :rtype: :class:`int`
+        """
+
+        return self._get_state(key).available - self.reserve
+
+    def select(
+        self: Self,
+        keys: Iterable[Hashable],
+        cost: int = 1,
+        /,
+    ) -> Hashable:
+        """
+        Selects the token with the most available points. When no
+        token can afford the cost, selects the token whose rate limit
+        window resets first.
+
+
+        Parameters
+        ----------
+        keys: Iterable[Hashable]
+            The tokens to select from.
+        cost: :class:`int`
+            The expected cost of the request in points.
+
+
+        :rtype: Hashable
+        """
+
+        states = [(key, self._get_state(key)) for key in keys]
+
+        key, state = max(states, key=lambda e: e[1].available)
+
+        if state.available - cost < self.reserve:
+            key, state = min(states, key=lambda e: e[1].resets_at or 0)
+
+        return key
+
+    async def acquire(
+        self: Self,
+        cost: int = 1,
+        /,
+        key: Hashable = None,
+    ) -> None:
+        """
+        |coro|
+
+        Waits until a request of the given cost can be sent without
+        dropping below the reserve.
+
+        Each call must be paired with a call to :meth:`release`.
+
+
+        Parameters
+        ----------
+        cost: :class:`int`
+            The expected cost of the request in points.
+        key: Hashable
+            The token the request is sent with.
+        """
+
+        state = self._get_state(key)
+        state.waiting += 1
+
+        try:
+            if state.semaphore is not None:
+                await state.semaphore.acquire()
+
+            try:
+                async with state.lock:
+                    while state.remaining is not None and state.remaining - state.reserved - cost < self.reserve:
+                        delay = (state.resets_at or 0) - time.time()
+
+                        if delay <= 0:
+                            # NOTE: the window has reset, the next
+                            #       response will correct our guess
+                            state.remaining = state.limit
+                            break
+
+                        await asyncio.sleep(delay)
+
+                    state.reserved += cost
+            except BaseException:
+                if state.semaphore is not None:
+                    state.semaphore.release()
+
+                raise
+        finally:
+            state.waiting -= 1
+
+        state.in_flight += 1
+
+    def release(
+        self: Self,
+        cost: int = 1,
+        /,
+        headers: Mapping[str, str] | None = None,
+        key: Hashable = None,
+    ) -> None:
+        """
+        Releases a request acquired with :meth:`acquire`.
+
+
+        Parameters
+        ----------
+        cost: :class:`int`
+            The expected cost of the request in points, as passed to
+            :meth:`acquire`.
+        headers: Optional[Mapping[:class:`str`, :class:`str`]]
+            The headers of the response, if any.
+        key: Hashable
+            The token the request was sent with.
+        """
+
+        state = self._get_state(key)
+        state.in_flight -= 1
+        state.reserved -= cost
+
+        if state.semaphore is not None:
+            state.semaphore.release()
+
+        if headers is not None:
+            self.update(headers, key)
+
+    def update(
+        self: Self,
+        headers: Mapping[str, str],
+        /,
+        key: Hashable = None,
+    ) -> None:
+        """
+        Updates the rate limit state from the headers of a response.
+
+
+        Parameters
+        ----------
+        headers: Mapping[:class:`str`, :class:`str`]
+            The headers of the response.
+        key: Hashable
+            The token the request was sent with.
+        """
+
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            resets_at = float(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+
+        state = self._get_state(key)
+
+        try:
+            state.limit = int(headers["X-RateLimit-Limit"])
+            state.used = int(headers["X-RateLimit-Used"])
+        except (KeyError, ValueError):
+            pass
+
+        state.remaining = remaining
+        state.resets_at = resets_at
+
+    def get_delay(
+        self: Self,
+        exception: ClientResponseError,
+        /,
+        key: Hashable = None,
+    ) -> float | None:
+        """
+        Computes the number of seconds to wait before retrying a
+        request which failed due to a rate limit.
+
+
+        Parameters
+        ----------
+        exception: :exc:`~github.core.errors.ClientResponseError`
+            The exception the request failed with.
+        key: Hashable
+            The token the request was sent with.
+
+
+        :rtype: Optional[:class:`float`]
+        """
+
+        response = exception.response
+
+        if response is None:
+            return None
+
+        headers = response.headers
+
+        if isinstance(exception, ClientResponseGraphQLRateLimitedError):
+            pass
+        elif isinstance(exception, ClientResponseHTTPError) and response.status in (403, 429):
+            if response.status == 403 and "Retry-After" not in headers and headers.get("X-RateLimit-Remaining") != "0":
+                # NOTE: this is a plain forbidden response
+                return None
+        else:
+            return None
+
+        try:
+            return float(headers["Retry-After"])
+        except (KeyError, ValueError):
+            pass
+
+        if headers.get("X-RateLimit-Remaining") == "0" or isinstance(exception, ClientResponseGraphQLRateLimitedError):
+            self.update(headers, key)
+
+            resets_at = self._get_state(key).resets_at
+
+            if resets_at is not None:
+                return max(resets_at - time.time(), 0.0) + 1.0
+
+        return DEFAULT_SECONDARY_DELAY
+
+
+__all__: list[str] = [
+    "RateLimiter",
+]
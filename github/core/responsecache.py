@@ -0,0 +1,281 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Hashable, Mapping
+    from typing_extensions import Self
+
+    from github.utility.types import T_json_object
+
+import re
+import time
+
+from github.utility import MISSING, LRUCache
+
+
+DEFAULT_MAX_SIZE: int = 256
+DEFAULT_PARSE_CACHE_SIZE: int = 1024
+DEFAULT_TTLS: dict[str, float] = {
+    "codeOfConduct": 3600.0,
+    "codesOfConduct": 3600.0,
+    "license": 3600.0,
+    "licenses": 3600.0,
+    "meta": 3600.0,
+    "topic": 600.0,
+}
+
+
+_viewer_regex = re.compile(r"\b(?:viewer|[_0-9A-Za-z]+Viewer)[_0-9A-Za-z]*\b")
+_token_regex = re.compile(r"""[\s,]+|#[^\n]*|"(?:[^"\\]|\\.)*"|([{}()]|\.\.\.|[_A-Za-z][_0-9A-Za-z]*|:)""")
+
+
+def _is_viewer_dependent(
+    document: str,
+    /,
+) -> bool:
+    # NOTE: matches viewer, viewer* fields such as viewerCanFollow,
+    #       and *Viewer fields such as isViewer
+    return _viewer_regex.search(document) is not None
+
+
+def _get_root_fields(
+    document: str,
+    /,
+) -> tuple[str, ...]:
+    # NOTE: collects the names, rather than the aliases, of the fields
+    #       selected at the root of the operation
+    fields = list()
+
+    braces = 0
+    parentheses = 0
+    previous = None
+
+    for token in _token_regex.findall(document):
+        if not token:
+            continue
+
+        if token == "{":
+            braces += 1
+        elif token == "}":
+            braces -= 1
+        elif token == "(":
+            parentheses += 1
+        elif token == ")":
+            parentheses -= 1
+        elif braces == 1 and not parentheses and token not in (":", "..."):
+            if previous == ":":
+                fields[-1] = token
+            else:
+                fields.append(token)
+
+        previous = token
+
+    return tuple(fields)
+
+
+class ResponseCache:
+    """
+    Caches the responses of queries for a time.
+
+    The time a response is cached for depends on the fields selected at
+    the root of its query, see ``ttls``. The response of a query which
+    selects a root field without a time is not cached. Nor is the
+    response of a query which selects a field that depends on the
+    authenticated user, such as ``viewerHasStarred``, as a mutation
+    may change it without sharing a variable with the query. Mutations
+    are never cached and invalidate the entries they may affect, see
+    :meth:`invalidate`.
+
+    You can subclass this class and override :meth:`get`, :meth:`set`,
+    and :meth:`invalidate` to share cached responses between
+    processes.
+
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        The maximum number of responses to cache. Defaults to ``256``.
+
+    ttls: Mapping[:class:`str`, :class:`float`]
+        The number of seconds to cache a response for, keyed by root
+        field. Defaults to an hour for ``codeOfConduct``,
+        ``codesOfConduct``, ``license``, ``licenses``, and ``meta``, and
+        ten minutes for ``topic``.
+
+    ttl: Optional[:class:`float`]
+        The number of seconds to cache a response for when a root field
+        is not in ``ttls``. Defaults to ``None``, which does not cache
+        such responses.
+
+
+    Attributes
+    ----------
+    hits: :class:`int`
+        The number of lookups which found a fresh response.
+
+    misses: :class:`int`
+        The number of lookups which did not.
+    """
+
+    __slots__ = ("hits", "misses", "ttl", "ttls", "_entries", "_root_fields")
+
+    def __init__(
+        self: Self,
+        /,
+        *,
+        max_size: int = MISSING,
+        ttls: Mapping[str, float] = MISSING,
+        ttl: float | None = MISSING,
+    ) -> None:
+        self.ttl: float | None = ttl if ttl is not MISSING else None
+        self.ttls: dict[str, float] = dict(ttls) if ttls is not MISSING else DEFAULT_TTLS.copy()
+
+        self._entries: LRUCache[Hashable, tuple[float, T_json_object, frozenset[Any]]] = LRUCache(max_size=max_size if max_size is not MISSING else DEFAULT_MAX_SIZE)
+        self._root_fields: LRUCache[str, tuple[str, ...]] = LRUCache(max_size=DEFAULT_PARSE_CACHE_SIZE)
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_ttl(
+        self: Self,
+        document: str,
+        /,
+    ) -> float | None:
+        """
+        Computes the number of seconds to cache the response of a query
+        for.
+
+
+        Parameters
+        ----------
+        document: :class:`str`
+            The GraphQL document.
+
+
+        :rtype: Optional[:class:`float`]
+        """
+
+        try:
+            fields = self._root_fields[document]
+        except KeyError:
+            # NOTE: a query which depends on the viewer is treated as
+            #       though it selected no root fields, which are not
+            #       cached
+            fields = self._root_fields[document] = () if _is_viewer_dependent(document) else _get_root_fields(document)
+
+        if not fields:
+            return None
+
+        ttls = [self.ttls.get(f, self.ttl) for f in fields]
+
+        if None in ttls:
+            return None
+
+        return min(ttls)  # type: ignore
+
+    def get(
+        self: Self,
+        key: Hashable,
+        /,
+    ) -> T_json_object | None:
+        """
+        Gets a cached response.
+
+
+        Parameters
+        ----------
+        key: Hashable
+            The key of the response.
+
+
+        :rtype: Optional[:class:`dict`]
+        """
+
+        try:
+            expires_at, data, _ = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def set(
+        self: Self,
+        key: Hashable,
+        data: T_json_object,
+        ttl: float,
+        /,
+        *,
+        variables: T_json_object = MISSING,
+    ) -> None:
+        """
+        Caches a response.
+
+
+        Parameters
+        ----------
+        key: Hashable
+            The key of the response.
+        data: :class:`dict`
+            The response.
+        ttl: :class:`float`
+            The number of seconds to cache the response for.
+        variables: :class:`dict`
+            The variables of the query, see :meth:`invalidate`.
+        """
+
+        values = frozenset(v for v in (variables if variables is not MISSING else dict()).values() if isinstance(v, str))
+
+        self._entries[key] = (time.monotonic() + ttl, data, values)
+
+    def invalidate(
+        self: Self,
+        document: str,
+        variables: T_json_object,
+        /,
+    ) -> None:
+        """
+        Invalidates the cached responses a mutation may affect.
+
+        A cached response is invalidated when its query shares a string
+        variable, such as the ID of a node, with the mutation.
+
+
+        Parameters
+        ----------
+        document: :class:`str`
+            The GraphQL document of the mutation.
+        variables: :class:`dict`
+            The variables of the mutation.
+        """
+
+        values = {v for v in variables.values() if isinstance(v, str)}
+
+        if not values:
+            return
+
+        for (key, (_, _, entry_values)) in list(self._entries._cache.items()):
+            if not values.isdisjoint(entry_values):
+                del self._entries[key]
+
+    def clear(
+        self: Self,
+        /,
+    ) -> None:
+        """
+        Invalidates all cached responses.
+        """
+
+        self._entries.clear()
+
+
+__all__: list[str] = [
+    "ResponseCache",
+]
@@ -0,0 +1,168 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+import asyncio
+import random
+
+import aiohttp
+
+from github.core.errors import ClientResponseGraphQLInternalError, ClientResponseHTTPError
+from github.utility import MISSING
+
+
+DEFAULT_ATTEMPTS: int = 3
+DEFAULT_BACKOFF: float = 1.0
+DEFAULT_MAXIMUM_DELAY: float = 30.0
+RETRYABLE_STATUSES: frozenset[int] = frozenset({500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Retries requests which fail due to transient faults.
+
+    A request is retried when it fails with a
+    :exc:`~github.core.errors.ClientResponseGraphQLInternalError`, an
+    HTTP 500, 502, 503, or 504 response, a connection error, or a
+    timeout. Between attempts, the policy waits for the duration of
+    the Retry-After header when present, and otherwise backs off
+    exponentially.
+
+    Rate limited requests are left to the
+    :class:`~github.RateLimiter`.
+
+
+    Parameters
+    ----------
+    attempts: :class:`int`
+        The maximum number of attempts to make for a request, including
+        the first. Defaults to ``3``.
+
+    backoff: :class:`float`
+        The number of seconds to wait before the first retry, doubled
+        for each retry thereafter. Defaults to ``1.0``.
+
+    maximum_delay: :class:`float`
+        The maximum number of seconds to back off between attempts.
+        Defaults to ``30.0``.
+
+    jitter: :class:`bool`
+        Whether to randomize the delay between zero and the backoff,
+        such that many clients do not retry in lockstep. Defaults to
+        ``True``.
+
+    retry_mutations: :class:`bool`
+        Whether to retry mutations. Defaults to ``False``.
+
+        .. warning::
+
+            A mutation which failed in transit may have been applied.
+            Retrying it may apply it twice.
+
+
+    Attributes
+    ----------
+    retries: :class:`int`
+        The number of retries made.
+
+    failures: :class:`int`
+        The number of requests which failed after exhausting their
+        attempts.
+    """
+
+    __slots__ = ("attempts", "backoff", "failures", "jitter", "maximum_delay", "retries", "retry_mutations")
+
+    def __init__(
+        self: Self,
+        /,
+        *,
+        attempts: int = MISSING,
+        backoff: float = MISSING,
+        maximum_delay: float = MISSING,
+        jitter: bool = MISSING,
+        retry_mutations: bool = MISSING,
+    ) -> None:
+        attempts = attempts if attempts is not MISSING else DEFAULT_ATTEMPTS
+
+        if attempts < 1:
+            raise ValueError("attempts must be a positive integer")
+
+        self.attempts: int = attempts
+        self.backoff: float = backoff if backoff is not MISSING else DEFAULT_BACKOFF
+        self.maximum_delay: float = maximum_delay if maximum_delay is not MISSING else DEFAULT_MAXIMUM_DELAY
+        self.jitter: bool = jitter if jitter is not MISSING else True
+        self.retry_mutations: bool = retry_mutations if retry_mutations is not MISSING else False
+
+        self.failures: int = 0
+        self.retries: int = 0
+
+    def is_retryable(
+        self: Self,
+        exception: BaseException,
+        /,
+    ) -> bool:
+        """
+        Whether a request which failed with the given exception may
+        succeed when retried.
+
+
+        Parameters
+        ----------
+        exception: :exc:`BaseException`
+            The exception the request failed with.
+
+
+        :rtype: :class:`bool`
+        """
+
+        if isinstance(exception, ClientResponseGraphQLInternalError):
+            return True
+
+        if isinstance(exception, ClientResponseHTTPError):
+            return exception.response is not None and exception.response.status in RETRYABLE_STATUSES
+
+        return isinstance(exception, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    def get_delay(
+        self: Self,
+        exception: BaseException,
+        attempt: int,
+        /,
+    ) -> float:
+        """
+        Computes the number of seconds to wait before retrying a
+        request.
+
+
+        Parameters
+        ----------
+        exception: :exc:`BaseException`
+            The exception the request failed with.
+        attempt: :class:`int`
+            The number of attempts made so far.
+
+
+        :rtype: :class:`float`
+        """
+
+        response = getattr(exception, "response", None)
+
+        if response is not None:
+            try:
+                return float(response.headers["Retry-After"])
+            except (KeyError, ValueError):
+                pass
+
+        delay = min(self.backoff * 2 ** (attempt - 1), self.maximum_delay)
+
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
+
+
+__all__: list[str] = [
+    "RetryPolicy",
+]
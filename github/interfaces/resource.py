@@ -7,8 +7,9 @@ if TYPE_CHECKING:
 
     from github.core.http import HTTPClient
     from github.interfaces.type import Type
-    from github.utility.types import T_json_key, T_json_value
+    from github.utility.types import T_json_key, T_json_object, T_json_value
 
+from github import utility
 from github.core.errors import ClientObjectMissingFieldError
 from github.utility import MISSING
 
@@ -70,6 +71,20 @@ class Resource:
         *,
         save: bool = MISSING,
     ) -> T_json_value:
+        data = await self._fetch_fields(field, save=save)
+        value = data[utility.get_graphql_key(field)]
+
+        if TYPE_CHECKING:
+            value = cast(T_json_value, value)
+
+        return value
+
+    async def _fetch_fields(
+        self: Self,
+        /,
+        *fields: T_json_key,
+        save: bool = MISSING,
+    ) -> T_json_object:
         save = save if save is not MISSING else True
 
         try:
@@ -85,14 +100,39 @@ class Resource:
         if TYPE_CHECKING:
             cls = cast(type[Type], cls)
 
-        data = await self._http.fetch_query_resource(cls, url, fields=(field,))
-
-        value = data[field]
+        data = await self._http.coalesce(self._http.fetch_query_resource, cls, url, fields=fields)
 
         if save:
-            self._data[field] = value
+            self._data.update(data)  # type: ignore
 
-        return value
+        return data
+
+    async def fetch_fields(
+        self: Self,
+        /,
+        *names: str,
+    ) -> None:
+        """
+        |coro|
+
+        Fetches the given fields of the resource in a single request.
+
+
+        Parameters
+        ----------
+        *names: :class:`str`
+            The names of the attributes to fetch. Defaults to all of
+            the attributes of the resource.
+
+
+        Raises
+        ------
+
+        ~github.core.errors.ClientObjectMissingFieldError
+            The :attr:`url` attribute is missing.
+        """
+
+        await self._fetch_fields(*(names or utility.get_defined_graphql_fields(self.__class__).keys()))  # type: ignore
 
     async def fetch_resource_path(
         self: Self,
@@ -8,7 +8,6 @@ if TYPE_CHECKING:
     from github.connections import Connection
     from github.interfaces import Node
     from github.user import User
-    from github.user.user import UserData
 
 import github
 from github.utility import MISSING
@@ -106,9 +105,11 @@ class Starrable:
         /,
         *,
         cursor: str | None = MISSING,
+        followers: int = MISSING,
         limit: int = MISSING,
         # order_by: StargazerOrder = MISSING,  # NOTE (stargazerorder): StargazerOrder has only one attribute
         reverse: bool = MISSING,
+        status: bool = MISSING,
     ) -> Connection[User]:
         """
         |aiter|
@@ -120,10 +121,20 @@ class Starrable:
         ----------
         cursor: :class:`str`
             The cursor to start at.
+        followers: :class:`int`
+            The maximum number of followers to fetch with each
+            stargazer. The first 100 are fetched in the same request as
+            the stargazer, and the rest in follow-up requests batched
+            across stargazers, see
+            :attr:`User.followers <github.User.followers>`.
         limit: :class:`int`
             The maximum number of elements to yield.
         reverse: :class:`bool`
             Whether to yield the elements in reverse order.
+        status: :class:`bool`
+            Whether to fetch the status of each stargazer, in the same
+            request as the stargazer, see
+            :attr:`User.status <github.User.status>`.
 
 
         Raises
@@ -139,14 +150,20 @@ class Starrable:
         if TYPE_CHECKING and not isinstance(self, Node):
             raise NotImplementedError
 
-        def userdata_to_user(userdata: UserData, /) -> User:
-            return github.User._from_data(userdata, http=self._http)
+        nested = list()
+
+        if followers is not MISSING:
+            nested.append(("followers", github.User, followers))
+
+        if status is not MISSING and status:
+            nested.append(("status", github.UserStatus, None))
 
         return github.Connection(
             self._http.collect_starrable_stargazers,
             self.id,
             None,  # order_by.value if order_by is not MISSING else None  # NOTE (stargazerorder): StargazerOrder has only one attribute
-            data_map=userdata_to_user,
+            data_type=github.User,
+            nested=nested,
             cursor=cursor if cursor is not MISSING else None,
             limit=limit if limit is not MISSING else None,
             reverse=reverse if reverse is not MISSING else False,
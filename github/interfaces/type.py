@@ -2,12 +2,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import ClassVar, Iterable, cast, overload
+    from typing import Any, ClassVar, Iterable, Mapping, cast, overload
     from typing_extensions import Self
 
     from github.core.http import HTTPClient
+    from github.utility import SlotDataWrapper
     from github.utility.types import T_json_object
 
+import types
+
 from github import utility
 from github.core.errors import ClientObjectMissingFieldError
 
@@ -21,7 +24,7 @@ if TYPE_CHECKING:
 
 
 class Type:
-    __slots__ = ("_data", "_http")
+    __slots__ = ("_data", "_http", "__weakref__")
 
     _data: TypeData
 
@@ -33,13 +36,35 @@ class Type:
 
     _graphql_type: ClassVar[str]
 
+    _data_wrapper: ClassVar[type[SlotDataWrapper]]
+
+    _defined_graphql_fields: ClassVar[Mapping[str, str]]
+    _defined_repr_fields: ClassVar[tuple[str, ...]]
+
+    def __init_subclass__(
+        cls: type[Self],
+        /,
+        **kwargs: Any,
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # NOTE: resolves the fields defined across the bases of each
+        #       type once, such that building a query or a repr only
+        #       needs to look them up
+        cls._defined_graphql_fields = types.MappingProxyType(utility.get_defined_graphql_fields(cls))
+        cls._defined_repr_fields = utility.get_defined_repr_fields(cls)
+
+        # NOTE: stores the fields of each instance in the slots of a
+        #       class generated for the type, rather than in a dict
+        cls._data_wrapper = utility.SlotDataWrapper._create(f"{cls.__name__}Data", cls.__module__, cls._defined_graphql_fields.values())
+
     def __init__(
         self: Self,
         data: T_json_object,
         http: HTTPClient | None = None,
         /,
     ) -> None:
-        self._data = utility.DataWrapper(data)  # type: ignore
+        self._data = self._data_wrapper(data)  # type: ignore
         self._http: HTTPClient | None = http
 
     def __repr__(
@@ -99,12 +124,38 @@ class Type:
             if TYPE_CHECKING:
                 data = cast(T_json_object, data)
 
-            return cls(data, http)
+            return cls._create(data, http)
         else:
             if TYPE_CHECKING:
                 data = cast(Iterable[T_json_object], data)
 
-            return [cls(o, http) for o in data]
+            return [cls._create(o, http) for o in data]
+
+    @classmethod
+    def _create(
+        cls: type[Self],
+        data: T_json_object,
+        http: HTTPClient | None = None,
+        /,
+    ) -> Self:
+        identity_map = http.identity_map if http is not None else None
+
+        if identity_map is None or "id" not in data.keys():
+            return cls(data, http)
+
+        # NOTE: merges the data into the object already created for the
+        #       node, such that its fields are visible everywhere
+        try:
+            object = identity_map[data["id"]]  # type: ignore
+        except KeyError:
+            pass
+        else:
+            if object.__class__ is cls:
+                object._data.update(data)  # type: ignore
+                return object  # type: ignore
+
+        object = identity_map[data["id"]] = cls(data, http)  # type: ignore
+        return object
 
 
 __all__: list[str] = [
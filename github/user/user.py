@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from github.interfaces.resource import ResourceData
     from github.interfaces.sponsorable import SponsorableData
     from github.interfaces.type import TypeData
+    from github.user.userstatus import UserStatusData
 
 
     class OptionalUserData(TypedDict, total=False):
@@ -83,6 +84,7 @@ if TYPE_CHECKING:
         isSiteAdmin: bool
         isViewer: bool
         pronouns: str | None
+        status: UserStatusData | None
         twitterUsername: str | None
         updatedAt: str
         viewerCanFollow: bool
@@ -154,9 +156,9 @@ class User(
         def _from_data(cls, data, /, *, http=None):
             if isinstance(data, dict):
                 if not data.get("isViewer", None):
-                    return cls(data, http)
+                    return cls._create(data, http)
                 else:
-                    return AuthenticatedUser(data, http)
+                    return AuthenticatedUser._create(data, http)
             else:
                 return [cls._from_data(o, http=http) for o in data]
 
@@ -277,6 +279,31 @@ class User(
 
         return self._data["followers"]["totalCount"]
 
+    @property
+    def followers(
+        self: Self,
+        /,
+    ) -> list[User]:
+        """
+        The users following the user.
+
+        .. note::
+
+            This field is not requested by default. It is requested by
+            :meth:`Starrable.fetch_stargazers <github.Starrable.fetch_stargazers>`
+            when given ``followers``, otherwise you should use
+            :attr:`~github.User.follower_count` instead.
+
+        :type: List[:class:`~github.User`]
+        """
+
+        try:
+            data = self._data["followers"]["nodes"]
+        except KeyError:
+            raise github.ClientObjectMissingFieldError("followers") from None
+
+        return github.User._from_data(data, http=self._http)
+
     @property
     def following_count(
         self: Self,
@@ -442,6 +469,31 @@ class User(
 
         return self._data["pronouns"]
 
+    @property
+    def status(
+        self: Self,
+        /,
+    ) -> UserStatus | None:
+        """
+        The user's status.
+
+        .. note::
+
+            This field is not requested by default. It is requested by
+            :meth:`Starrable.fetch_stargazers <github.Starrable.fetch_stargazers>`
+            when given ``status``, otherwise you should use
+            :meth:`~github.User.fetch_status` instead.
+
+        :type: Optional[:class:`~github.UserStatus`]
+        """
+
+        data = self._data["status"]
+
+        if data is None:
+            return None
+
+        return github.UserStatus._from_data(data, http=self._http)
+
     @property
     def twitter_username(
         self: Self,
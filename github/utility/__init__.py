@@ -1,7 +1,11 @@
 from github.utility._mirror import *
 from github.utility._mirror import __all__ as __mirror__all__
+from github.utility.cache import *
+from github.utility.cache import __all__ as _cache__all__
 from github.utility.convert import *
 from github.utility.convert import __all__ as _convert__all__
+from github.utility.cost import *
+from github.utility.cost import __all__ as _cost__all__
 from github.utility.helpers import *
 from github.utility.helpers import __all__ as _helpers__all__
 from github.utility.wrapper import *
@@ -10,7 +14,9 @@ from github.utility.wrapper import __all__ as _wrapper__all__
 
 __all__: list[str] = [  # type: ignore[reportUnsupportedDunderAll]
     *__mirror__all__,
+    *_cache__all__,
     *_convert__all__,
+    *_cost__all__,
     *_helpers__all__,
     *_wrapper__all__,
 ]
@@ -252,6 +252,8 @@ class SizedCache(Cache[_K, _V]):
         *,
         max_size: int,
     ) -> None:
+        super().__init__()
+
         self._max_size: int = MISSING
 
         self.max_size = max_size
@@ -0,0 +1,172 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Awaitable, Callable, Coroutine, Hashable, TypeVar, overload
+    from typing_extensions import ParamSpec, TypeAlias
+
+    _P = ParamSpec("_P")
+    _T = TypeVar("_T")
+
+    _CoroutineFunc: TypeAlias = Callable[_P, Coroutine[Any, Any, _T]]
+
+import asyncio
+import functools
+import time
+
+from github.utility import MISSING, Cache, LRUCache
+
+
+def _make_key(
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    /,
+) -> Hashable:
+    # NOTE: the arguments themselves, rather than their hash, such that
+    #       calls whose arguments only share a hash do not share a
+    #       result
+    return (args, frozenset(kwargs.items()))
+
+
+if TYPE_CHECKING:
+
+    @overload
+    def async_cache(
+        wrapped: _CoroutineFunc[_P, _T],
+        /,
+    ) -> Callable[_P, Awaitable[_T]]: ...
+
+    @overload
+    def async_cache(
+        *,
+        max_size: int | None = ...,
+        ttl: float | None = ...,
+        exceptions: tuple[type[BaseException], ...] = ...,
+    ) -> Callable[[_CoroutineFunc[_P, _T]], Callable[_P, Awaitable[_T]]]: ...
+
+
+def async_cache(
+    wrapped: _CoroutineFunc[_P, _T] = MISSING,
+    /,
+    *,
+    max_size: int | None = MISSING,
+    ttl: float | None = MISSING,
+    exceptions: tuple[type[BaseException], ...] = MISSING,
+) -> Callable[_P, Awaitable[_T]] | Callable[[_CoroutineFunc[_P, _T]], Callable[_P, Awaitable[_T]]]:
+    """
+    Caches the results of a coroutine function by its arguments.
+
+    Concurrent calls with the same arguments share one call of the
+    wrapped function. The cache is available as ``__utility_cache__``
+    on the wrapper, and counts hits and misses.
+
+
+    Parameters
+    ----------
+    max_size: Optional[:class:`int`]
+        The maximum number of results to cache. ``None`` or ``-1`` does
+        not limit the cache. Defaults to ``1024``.
+
+    ttl: Optional[:class:`float`]
+        The number of seconds to cache a result for. Defaults to
+        ``None``, which caches results until they are evicted.
+
+    exceptions: Tuple[Type[:exc:`BaseException`], ...]
+        The exceptions to cache, such that subsequent calls raise them
+        rather than calling the wrapped function again. Defaults to
+        ``()``.
+    """
+
+    max_size = max_size if max_size is not MISSING else 1024
+
+    if isinstance(max_size, int):
+        if max_size < -1 or max_size == 0:
+            raise ValueError("max_size must be None, -1, or a positive integer")
+
+    ttl = ttl if ttl is not MISSING else None
+    exceptions = exceptions if exceptions is not MISSING else ()
+
+    def decorator(
+        wrapped: _CoroutineFunc[_P, _T],
+        /,
+    ) -> Callable[_P, Awaitable[_T]]:
+        cache: Cache[Hashable, tuple[float | None, bool, Any]]
+
+        if max_size == -1 or max_size is None:
+            cache = Cache()
+        else:
+            cache = LRUCache(max_size=max_size)
+
+        pending: dict[Hashable, asyncio.Future[_T]] = dict()
+
+        def store(
+            key: Hashable,
+            future: asyncio.Future[_T],
+            /,
+        ) -> None:
+            del pending[key]
+
+            if future.cancelled():
+                return
+
+            exception = future.exception()
+
+            if exception is not None and not isinstance(exception, exceptions):
+                return
+
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+
+            if exception is not None:
+                cache[key] = (expires_at, True, exception.with_traceback(None))
+            else:
+                cache[key] = (expires_at, False, future.result())
+
+        @functools.wraps(wrapped)
+        async def inner(
+            *args: _P.args,
+            **kwargs: _P.kwargs,
+        ) -> _T:
+            key = _make_key(args, kwargs)
+
+            try:
+                expires_at, failed, value = cache[key]
+            except KeyError:
+                pass
+            else:
+                if expires_at is None or expires_at > time.monotonic():
+                    if failed:
+                        # NOTE: raising the cached exception would chain
+                        #       the frames of every caller onto it
+                        raise value.with_traceback(None)
+
+                    return value
+
+                del cache[key]
+
+                # NOTE: an expired result is a miss
+                cache.hits -= 1
+                cache.misses += 1
+
+            try:
+                future = pending[key]
+            except KeyError:
+                future = pending[key] = asyncio.ensure_future(wrapped(*args, **kwargs))
+                future.add_done_callback(functools.partial(store, key))
+
+            # NOTE: the future is shared with other callers, so one of
+            #       them being cancelled must not cancel it for the rest
+            return await asyncio.shield(future)
+
+        inner.__utility_cache__ = cache  # type: ignore
+
+        return inner
+
+    if wrapped is MISSING:
+        return decorator
+
+    return decorator(wrapped)
+
+
+__all__: list[str] = [
+    "async_cache",
+]
@@ -5,7 +5,9 @@ if TYPE_CHECKING:
     from github.utility.types import Date, DateTime
 
 import base64
+import binascii
 import datetime
+import re
 import struct
 
 import github
@@ -70,6 +72,97 @@ def iso_to_datetime(
     return datetime.datetime.fromisoformat(iso.replace("Z", "+00:00"))
 
 
+_cursor_prefix: bytes = b"cursor:v2:"
+_cursor_timestamp_regex = re.compile(r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(\.\d+)?(Z|[+-]\d{2}:\d{2})$")
+
+
+def _decode_cursor(
+    cursor: str,
+    /,
+) -> bytes:
+    try:
+        data = base64.b64decode(cursor, validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError(f"invalid cursor {cursor!r}") from None
+
+    if not data.startswith(_cursor_prefix):
+        raise ValueError(f"invalid cursor {cursor!r}")
+
+    return data[len(_cursor_prefix):]
+
+
+def _unpack_cursor(
+    cursor: str,
+    /,
+) -> list[int | str]:
+    # NOTE: cursors are "cursor:v2:" followed by a msgpack array of the
+    #       values of the connection's order key, of which only the
+    #       integers and strings seen in GitHub cursors are decoded
+    data = _decode_cursor(cursor)
+
+    if not data or not 0x90 <= data[0] <= 0x9F:
+        raise ValueError(f"invalid cursor {cursor!r}")
+
+    values = list()
+    i = 1
+
+    try:
+        for _ in range(data[0] & 0x0F):
+            tag = data[i]
+            i += 1
+
+            if tag <= 0x7F:
+                values.append(tag)
+            elif tag in (0xCC, 0xCD, 0xCE, 0xCF):
+                format = {0xCC: ">B", 0xCD: ">H", 0xCE: ">I", 0xCF: ">Q"}[tag]
+                values.append(struct.unpack_from(format, data, i)[0])
+                i += struct.calcsize(format)
+            elif 0xA0 <= tag <= 0xBF or tag == 0xD9:
+                if tag == 0xD9:
+                    length = data[i]
+                    i += 1
+                else:
+                    length = tag & 0x1F
+
+                if i + length > len(data):
+                    raise ValueError
+
+                values.append(data[i:i + length].decode("utf-8"))
+                i += length
+            else:
+                raise ValueError
+    except (IndexError, struct.error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"unsupported cursor {cursor!r}") from None
+
+    if i != len(data):
+        raise ValueError(f"unsupported cursor {cursor!r}")
+
+    return values
+
+
+def _pack_cursor(
+    values: list[int | str],
+    /,
+) -> str:
+    data = bytearray(_cursor_prefix)
+    data.append(0x90 | len(values))
+
+    for value in values:
+        if isinstance(value, str):
+            encoded = value.encode("utf-8")
+
+            if len(encoded) <= 0x1F:
+                data.append(0xA0 | len(encoded))
+            else:
+                data += bytes((0xD9, len(encoded)))
+
+            data += encoded
+        else:
+            data += b"\xCE" + struct.pack(">I", value)
+
+    return base64.b64encode(bytes(data)).decode("utf-8")
+
+
 def cursor_to_database(
     cursor: str,
     /,
@@ -94,6 +187,66 @@ def database_to_cursor(
     return base64.b64encode(cursor).decode("utf-8")
 
 
+def split_cursors(
+    start: str,
+    stop: str,
+    count: int,
+    /,
+) -> list[str]:
+    # NOTE: computes up to count - 1 cursors which divide the range
+    #       between start and stop evenly. this supports connections
+    #       ordered by database ID, whose cursors encode [id], and
+    #       connections ordered by a timestamp, whose cursors encode
+    #       [timestamp, id]
+    a = _unpack_cursor(start)
+    b = _unpack_cursor(stop)
+
+    if len(a) == len(b) == 1 and isinstance(a[0], int) and isinstance(b[0], int):
+        first_id, last_id = a[0], b[0]
+
+        points = [first_id + (last_id - first_id) * i // count for i in range(1, count)]
+        bounds = (first_id, last_id)
+    elif len(a) == len(b) == 2 and isinstance(a[0], str) and isinstance(b[0], str):
+        match = _cursor_timestamp_regex.match(a[0])
+
+        if match is None or _cursor_timestamp_regex.match(b[0]) is None:
+            raise ValueError(f"unsupported cursor {start!r}")
+
+        first_at, last_at = iso_to_datetime(a[0]), iso_to_datetime(b[0])
+
+        points = [first_at + (last_at - first_at) * i / count for i in range(1, count)]
+        bounds = (first_at, last_at)
+    else:
+        raise ValueError(f"unsupported cursor {start!r}")
+
+    cursors = list()
+    previous = None
+
+    for point in points:
+        if point == previous or not bounds[0] < point < bounds[1]:  # type: ignore
+            continue
+
+        previous = point
+
+        if isinstance(point, int):
+            cursors.append(_pack_cursor([point]))
+        else:
+            if TYPE_CHECKING:
+                assert match is not None
+
+            # NOTE: keeps the precision and offset of the timestamps in
+            #       the cursors of the connection. a range starts after
+            #       ID 0 at its timestamp, such that it includes every
+            #       item at the timestamp
+            fraction, offset = match.group(2) or "", match.group(3)
+            point = point.astimezone(first_at.tzinfo)
+            timestamp = point.strftime("%Y-%m-%dT%H:%M:%S") + (f".{point.microsecond:06}".ljust(len(fraction), "0")[:len(fraction)] if fraction else "") + offset
+
+            cursors.append(_pack_cursor([timestamp, 0]))
+
+    return cursors
+
+
 def database_to_node(
     id: int,
     type: str,
@@ -138,4 +291,5 @@ __all__: list[str] = [
     "database_to_node",
     "node_to_cursor",
     "node_to_database",
+    "split_cursors",
 ]
@@ -0,0 +1,266 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from typing import Tuple, Union
+    from typing_extensions import TypeAlias
+
+    from github.utility.types import T_json_object
+
+    # NOTE: ("connection", first, last, items) or ("spread", name, None,
+    #       ()) where first and last are int literals, variable names,
+    #       or None
+    _Item: TypeAlias = Tuple[str, Union[int, str, None], Union[int, str, None], Tuple["_Item", ...]]
+
+import re
+
+from github.utility import MISSING, LRUCache
+
+
+DEFAULT_CONNECTION_SIZE: int = 100
+DEFAULT_PARSE_CACHE_SIZE: int = 1024
+MAXIMUM_NODE_LIMIT: int = 500000
+
+
+class CostEstimate(NamedTuple):
+    cost: int
+    node_count: int
+
+
+_token_regex = re.compile(r"""[\s,]+|#[^\n]*|(\.\.\.|[{}()\[\]:!$=@|&]|"(?:[^"\\]|\\.)*"|-?[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|[_A-Za-z][_0-9A-Za-z]*)""")
+
+
+def _tokenize(
+    document: str,
+    /,
+) -> list[str]:
+    return [t for t in _token_regex.findall(document) if t]
+
+
+def _skip_balanced(
+    tokens: list[str],
+    i: int,
+    /,
+) -> int:
+    pairs = {"(": ")", "[": "]", "{": "}"}
+    stack = [pairs[tokens[i]]]
+    i += 1
+
+    while stack:
+        if tokens[i] in pairs:
+            stack.append(pairs[tokens[i]])
+        elif tokens[i] == stack[-1]:
+            stack.pop()
+
+        i += 1
+
+    return i
+
+
+def _skip_directives(
+    tokens: list[str],
+    i: int,
+    /,
+) -> int:
+    while tokens[i] == "@":
+        i += 2
+
+        if tokens[i] == "(":
+            i = _skip_balanced(tokens, i)
+
+    return i
+
+
+def _parse_arguments(
+    tokens: list[str],
+    i: int,
+    /,
+) -> tuple[dict[str, int | str | None], int]:
+    arguments = dict()
+    i += 1
+
+    while tokens[i] != ")":
+        name = tokens[i]
+        i += 2
+
+        if tokens[i] == "$":
+            arguments[name] = tokens[i + 1]
+            i += 2
+        elif tokens[i] in ("[", "{"):
+            arguments[name] = None
+            i = _skip_balanced(tokens, i)
+        else:
+            try:
+                arguments[name] = int(tokens[i])
+            except ValueError:
+                arguments[name] = None
+
+            i += 1
+
+    return arguments, i + 1
+
+
+def _parse_selections(
+    tokens: list[str],
+    i: int,
+    /,
+) -> tuple[list[_Item], int]:
+    items = list()
+    i += 1
+
+    while tokens[i] != "}":
+        if tokens[i] == "...":
+            if tokens[i + 1] == "on":
+                i = _skip_directives(tokens, i + 3)
+            elif tokens[i + 1] in ("{", "@"):
+                i = _skip_directives(tokens, i + 1)
+            else:
+                items.append(("spread", tokens[i + 1], None, ()))
+                i = _skip_directives(tokens, i + 2)
+                continue
+
+            selections, i = _parse_selections(tokens, i)
+            items.extend(selections)
+            continue
+
+        i += 1
+
+        if tokens[i] == ":":
+            i += 2
+
+        arguments = dict()
+
+        if tokens[i] == "(":
+            arguments, i = _parse_arguments(tokens, i)
+
+        i = _skip_directives(tokens, i)
+
+        selections = list()
+
+        if tokens[i] == "{":
+            selections, i = _parse_selections(tokens, i)
+
+        if "first" in arguments.keys() or "last" in arguments.keys():
+            items.append(("connection", arguments.get("first"), arguments.get("last"), tuple(selections)))
+        else:
+            # NOTE: only connections contribute to the cost, so the
+            #       selections of other fields are flattened
+            items.extend(selections)
+
+    return items, i + 1
+
+
+def _parse(
+    document: str,
+    /,
+) -> tuple[tuple[_Item, ...], dict[str, tuple[_Item, ...]]]:
+    tokens = _tokenize(document)
+
+    items = list()
+    fragments = dict()
+
+    i = 0
+    while i < len(tokens):
+        if tokens[i] == "fragment":
+            name = tokens[i + 1]
+
+            while tokens[i] != "{":
+                i += 1
+
+            selections, i = _parse_selections(tokens, i)
+            fragments[name] = tuple(selections)
+        elif tokens[i] == "{":
+            selections, i = _parse_selections(tokens, i)
+            items.extend(selections)
+        elif tokens[i] == "(":
+            i = _skip_balanced(tokens, i)
+        else:
+            i += 1
+
+    return tuple(items), fragments
+
+
+_parse_cache: LRUCache[str, tuple[tuple[_Item, ...], dict[str, tuple[_Item, ...]]]] = LRUCache(max_size=DEFAULT_PARSE_CACHE_SIZE)
+
+
+def _resolve(
+    value: int | str | None,
+    variables: T_json_object,
+    /,
+) -> int | None:
+    if isinstance(value, str):
+        value = variables.get(value)  # type: ignore
+
+    if isinstance(value, int):
+        return value
+
+    return None
+
+
+def _evaluate(
+    items: tuple[_Item, ...],
+    fragments: dict[str, tuple[_Item, ...]],
+    variables: T_json_object,
+    multiplier: int,
+    seen: frozenset[str],
+    /,
+) -> tuple[int, int]:
+    requests = 0
+    nodes = 0
+
+    for (kind, first, last, selections) in items:
+        if kind == "spread":
+            if TYPE_CHECKING:
+                assert isinstance(first, str)
+
+            if first in seen or first not in fragments.keys():
+                continue
+
+            r, n = _evaluate(fragments[first], fragments, variables, multiplier, seen | {first})
+        else:
+            size = _resolve(first, variables)
+
+            if size is None:
+                size = _resolve(last, variables)
+
+            if size is None:
+                size = DEFAULT_CONNECTION_SIZE
+
+            requests += multiplier
+            nodes += multiplier * size
+
+            r, n = _evaluate(selections, fragments, variables, multiplier * size, seen)
+
+        requests += r
+        nodes += n
+
+    return requests, nodes
+
+
+def estimate_cost(
+    document: str,
+    variables: T_json_object = MISSING,
+    /,
+) -> CostEstimate:
+    variables = variables if variables is not MISSING else dict()
+
+    try:
+        items, fragments = _parse_cache[document]
+    except KeyError:
+        try:
+            items, fragments = _parse(document)
+        except (IndexError, KeyError):
+            raise ValueError("could not parse document") from None
+
+        _parse_cache[document] = (items, fragments)
+
+    requests, nodes = _evaluate(items, fragments, variables, 1, frozenset())
+
+    return CostEstimate(max(1, int(requests / 100 + 0.5)), nodes)
+
+
+__all__: list[str] = [
+    "MAXIMUM_NODE_LIMIT",
+    "CostEstimate",
+    "estimate_cost",
+]
@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Iterable
+    from typing import Iterable, Mapping
 
     from github import Type
     from github.utility.types import T_json_key, T_json_object, T_json_value
@@ -27,6 +27,13 @@ def follow(
     return functools.reduce(__getitem__, path, data)
 
 
+def get_graphql_key(
+    field: str,
+    /,
+) -> str:
+    return field.split("(", 1)[0].split("{", 1)[0]
+
+
 def get_graphql_type(
     type: type[Type],
     /,
@@ -42,7 +49,12 @@ def get_graphql_type(
 def get_defined_graphql_fields(
     type: type[Type],
     /,
-) -> dict[str, str]:
+) -> Mapping[str, str]:
+    try:
+        return type.__dict__["_defined_graphql_fields"]
+    except KeyError:
+        pass
+
     try:
         if isinstance(type._graphql_fields, dict):
             defined_fields = type._graphql_fields.copy()
@@ -88,7 +100,12 @@ def get_merged_graphql_fields(
 def get_defined_repr_fields(
     type: type[Type],
     /,
-) -> list[str]:
+) -> tuple[str, ...]:
+    try:
+        return type.__dict__["_defined_repr_fields"]
+    except KeyError:
+        pass
+
     try:
         repr_fields = type._repr_fields.copy()
     except AttributeError:
@@ -99,11 +116,12 @@ def get_defined_repr_fields(
             if element not in repr_fields:
                 repr_fields.append(element)
 
-    return sorted(repr_fields)
+    return tuple(sorted(repr_fields))
 
 
 __all__: list[str] = [
     "follow",
+    "get_graphql_key",
     "get_graphql_type",
     "get_defined_graphql_fields",
     "get_merged_graphql_fields",
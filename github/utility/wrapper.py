@@ -1,34 +1,245 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Dict, TypeVar
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Any, Callable, ClassVar, Iterable, Iterator, Mapping
     from typing_extensions import Self
 
+import collections.abc
+
 from github.core.errors import ClientObjectMissingFieldError
+from github.utility.helpers import get_graphql_key
 
 
-if TYPE_CHECKING:
-    from github.utility.types import T_json_key, T_json_value
+DEFAULT_SLOT_PREFIX: str = "_f_"
+
+
+_marker = object()
+
+
+class _LazyValue:
+    __slots__ = ("load",)
+
+    def __init__(
+        self: Self,
+        load: Callable[[], Any],
+        /,
+    ) -> None:
+        self.load: Callable[[], Any] = load
+
 
-    _K = TypeVar("_K", bound=T_json_key)
-    _V = TypeVar("_V", bound=T_json_value)
-else:
-    _K = TypeVar("_K")
-    _V = TypeVar("_V")
+class SlotDataWrapper(collections.abc.MutableMapping):
+    # NOTE: stores each expected key in a slot of a class generated
+    #       for the type, see _create, rather than in a dict per
+    #       instance. keys outside of those expected, such as fields
+    #       which are not requested by default, fall back to a dict
+    #       which is only created once one is set
+    __slots__ = ("_extra",)
 
+    _slot_names: ClassVar[dict[str, str]] = dict()
+
+    def __init__(
+        self: Self,
+        data: Mapping[str, Any],
+        /,
+    ) -> None:
+        self._extra: dict[str, Any] | None = None
+        self.update(data)
+
+    @classmethod
+    def _create(
+        cls: type[Self],
+        name: str,
+        module: str,
+        fields: Iterable[str],
+        /,
+    ) -> type[Self]:
+        slot_names = {k: DEFAULT_SLOT_PREFIX + k for k in dict.fromkeys(get_graphql_key(f) for f in fields) if k.isidentifier()}
+
+        namespace = {
+            "__module__": module,
+            "__qualname__": name,
+            "__slots__": tuple(slot_names.values()),
+            "_slot_names": slot_names,
+        }
+
+        return type(name, (cls,), namespace)  # type: ignore
 
-class DataWrapper(Dict[_K, _V]):
     def __getitem__(
         self: Self,
-        key: _K,
+        key: str,
+        /,
+    ) -> Any:
+        try:
+            return getattr(self, self._slot_names[key])
+        except (AttributeError, KeyError):
+            pass
+
+        if self._extra is None or key not in self._extra.keys():
+            raise ClientObjectMissingFieldError(key)
+
+        value = self._extra[key]
+
+        if isinstance(value, _LazyValue):
+            value = value.load()
+
+            del self._extra[key]
+            self[key] = value
+
+        return value
+
+    def __setitem__(
+        self: Self,
+        key: str,
+        value: Any,
+        /,
+    ) -> None:
+        try:
+            setattr(self, self._slot_names[key], value)
+        except KeyError:
+            if self._extra is None:
+                self._extra = dict()
+
+            self._extra[key] = value
+
+    def __delitem__(
+        self: Self,
+        key: str,
+        /,
+    ) -> None:
+        try:
+            delattr(self, self._slot_names[key])
+        except KeyError:
+            if self._extra is None:
+                raise
+
+            del self._extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(
+        self: Self,
+        key: object,
         /,
-    ) -> _V:
+    ) -> bool:
         try:
-            return super().__getitem__(key)
+            if hasattr(self, self._slot_names[key]):  # type: ignore
+                return True
         except KeyError:
-            raise ClientObjectMissingFieldError(key) from None
+            pass
+
+        return self._extra is not None and key in self._extra.keys()
+
+    def __iter__(
+        self: Self,
+        /,
+    ) -> Iterator[str]:
+        for (key, slot_name) in self._slot_names.items():
+            if hasattr(self, slot_name):
+                yield key
+
+        if self._extra is not None:
+            for key in self._extra.keys():
+                # NOTE: a lazy value may have been set since
+                if key not in self._slot_names.keys() or not hasattr(self, self._slot_names[key]):
+                    yield key
+
+    def __len__(
+        self: Self,
+        /,
+    ) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(
+        self: Self,
+        /,
+    ) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
+
+    # NOTE: __getitem__ raises ClientObjectMissingFieldError, which is
+    #       not a KeyError, so the methods of MutableMapping which rely
+    #       on a KeyError are overridden
+
+    def get(
+        self: Self,
+        key: str,
+        default: Any = None,
+        /,
+    ) -> Any:
+        try:
+            return self[key]
+        except ClientObjectMissingFieldError:
+            return default
+
+    def pop(
+        self: Self,
+        key: str,
+        default: Any = _marker,
+        /,
+    ) -> Any:
+        try:
+            value = self[key]
+        except ClientObjectMissingFieldError:
+            if default is _marker:
+                raise KeyError(key) from None
+
+            return default
+
+        del self[key]
+
+        return value
+
+    def popitem(
+        self: Self,
+        /,
+    ) -> tuple[str, Any]:
+        try:
+            key = next(iter(self))
+        except StopIteration:
+            raise KeyError("popitem(): wrapper is empty") from None
+
+        return (key, self.pop(key))
+
+    def setdefault(
+        self: Self,
+        key: str,
+        default: Any = None,
+        /,
+    ) -> Any:
+        try:
+            return self[key]
+        except ClientObjectMissingFieldError:
+            self[key] = default
+
+            return default
+
+    def set_lazy(
+        self: Self,
+        key: str,
+        load: Callable[[], Any],
+        /,
+    ) -> None:
+        # NOTE: the value is loaded on first access, unless it is set
+        #       beforehand
+        if self._extra is None:
+            self._extra = dict()
+
+        self._extra[key] = _LazyValue(load)
+
+    def update(
+        self: Self,
+        data: Mapping[str, Any],
+        /,
+    ) -> None:
+        slot_names = self._slot_names
+
+        for (key, value) in data.items():
+            try:
+                setattr(self, slot_names[key], value)
+            except KeyError:
+                self[key] = value
 
 
 __all__: list[str] = [
-    "DataWrapper",
+    "SlotDataWrapper",
 ]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import unittest
+
+import github
+from github.core.http import HTTPClient
+
+
+class FakeHTTPClient(HTTPClient):
+    __slots__ = ("requests", "starred")
+
+    def __init__(
+        self,
+        /,
+        **kwargs,
+    ) -> None:
+        super().__init__("token", None, None, **kwargs)  # type: ignore
+
+        self.requests: list[str] = list()
+        self.starred: bool = False
+
+    async def _request_sent(self, document_, operation_, variables_, /, *, headers, **kwargs):
+        self.requests.append(document_)
+
+        if document_.startswith("mutation"):
+            self.starred = True
+
+            return {"addStar": {"starrable": {"__typename": "Topic", "id": variables_["starrable_id"], "viewerHasStarred": True}}}
+
+        if "license(" in document_:
+            return {"license": {"__typename": "License", "id": "L", "key": variables_["key"], "name": "MIT License"}}
+
+        return {"topic": {"__typename": "Topic", "id": "T", "name": variables_["name"], "viewerHasStarred": self.starred}}
+
+
+class TestResponseCache(unittest.IsolatedAsyncioTestCase):
+    async def test_mutate_then_fetch(self) -> None:
+        http = FakeHTTPClient(response_cache=github.ResponseCache())
+
+        topic = await http.fetch_query_topic("python")
+        self.assertFalse(topic["viewerHasStarred"])
+
+        await http.mutate_starrable_star(topic["id"], fields=("viewerHasStarred",))
+
+        topic = await http.fetch_query_topic("python")
+        self.assertTrue(topic["viewerHasStarred"])
+
+        self.assertEqual(len(http.requests), 3)
+
+    async def test_cached(self) -> None:
+        cache = github.ResponseCache()
+        http = FakeHTTPClient(response_cache=cache)
+
+        for _ in range(2):
+            license = await http.fetch_query_license("mit")
+            self.assertEqual(license["name"], "MIT License")
+
+        self.assertEqual(len(http.requests), 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_viewer_dependent_ttl(self) -> None:
+        cache = github.ResponseCache()
+
+        self.assertIsNone(cache.get_ttl("query($name:String!){topic(name:$name){name,viewerHasStarred}}"))
+        self.assertEqual(cache.get_ttl("query($name:String!){topic(name:$name){name}}"), 600.0)
+
+
+if __name__ == "__main__":
+    unittest.main()